@@ -1,339 +1,104 @@
 # app.py — Streamlit portfolio for Lakshmi Manaswini Pulicharla
 # ----------------------------------------------------
 # Run locally:  streamlit run app.py
-# Requirements: streamlit, pillow
+# Requirements: streamlit, pillow, numpy, pypdf (build-time, for the resume index)
+# Optional:     python -m portfolio.images   (pre-build resized image variants)
+#               python -m portfolio.snapshot (prebuilt startup state for fast cold starts)
+#               python -m portfolio.shared   (publish assets once for all worker processes)
+#               python -m portfolio.resume   (index the resume PDF for the chatbot; needs pypdf)
+#               python -m portfolio.export   (static HTML export of the non-chat sections)
 
 import streamlit as st
-from PIL import Image
-import base64
 import os
+import time
+import uuid
+from html import escape
 
-def img_to_base64(path):
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
+from portfolio import assets, cards, chat, content, downloads, events, images, llm, metrics, ratelimit, search, snapshot, styles
 
-# -------------------------
-# DATA from resume
-# -------------------------         
-PROFILE = {
-    "name": "Lakshmi Manaswini Pulicharla",
-    "role": "AI & ML Engineer | Data Scientist",
-    "email": "plakshmimanaswini@gmail.com",
-    "phone": "+1 314-913-6194",
-    "location": "Saint Louis, Missouri, USA",
-    "about": (
-        "Experienced Machine Learning Engineer skilled in developing and deploying end-to-end AI and analytics solutions."
-        "Expertise in real-time monitoring systems, SQL pipeline optimization, and predictive modeling using Scikit-learn "
-        "and PyTorch. Proficient in Python, SQL, and data visualization, with strong foundations in statistical analysis, model"
-        "optimization, and automation. Passionate about delivering scalable, data-driven solutions that enhance decision-making and "
-        "business performance."
-    ),
-    "photo_path": "assets/profile.jpg",
-    "github": "https://github.com/LakshmiManaswini-7",
-    "linkedin": "https://www.linkedin.com/in/lakshmi-manaswini-pulicharla",
-}
-
-SKILLS = {
-    "Programming": ["Python", "Java", "C++", "C"],
-    "Libraries/Frameworks": ["NumPy", "Pandas", "Scikit-learn", "TensorFlow", "PyTorch", "Keras", "XGBoost"],
-    "ML Techniques": ["Regression", "Decision Trees", "Random Forest", "Gradient Boosting", "SVMs", "Clustering", "PCA", "Time-Series Forecasting", "Anomaly Detection"],
-    "Deep Learning": ["Neural Networks", "NLP", "Computer Vision,LLM"],
-    "Math/Stats": ["Probability", "Statistics", "Linear Algebra"],
-    "Visualization": ["Matplotlib", "Seaborn", "Power BI"],
-    "Databases": ["MySQL", "SQL Server"],
-    "Tools": ["Git", "Docker", "Flask", "Jupyter", "VS Code", "PyCharm"],
-}
+# adopt the deploy-time snapshot (python -m portfolio.snapshot) if it is current
+snapshot.boot()
 
 # -------------------------
-# EXPERIENCE (now includes Learning Assistant)
+# DATA from resume — content/profile.json, compiled into frozen records and
+# reloaded when the file changes (see portfolio/content.py). ?profile=<slug>
+# serves content/profiles/<slug>.json instead.
 # -------------------------
-EXPERIENCE = [
-    {
-        "company": "Southeast Missouri State University",
-        "role": "Learning Assistant",
-        "period": "Aug 2024 – Present",
-        "location": "Cape Girardeau, Missouri, USA",
-        "bullets": [
-            "Conducted 1-on-1 and group tutoring sessions for Computer Science, Machine Learning, and Statistics courses.",  
-            "Guided students in applying Python for data analysis, statistical modeling, and ML algorithm implementation.",  
-            "Mentored learners on probability, hypothesis testing, and data-driven decision-making concepts.",  
-            "Assisted with coding assignments, model evaluation, and performance optimization tasks.",  
-            "Collaborated with faculty to create interactive learning materials, improving student engagement and comprehension in AI and analytical subjects."
-        ],
-        "tech": ["Tutoring", "Python", "Data Structures", "Algorithms"],
-    },
-    {
-        "company": "Value Information Technology Solutions Pvt. Ltd.",
-        "role": "Machine Learning & Analytics Intern",
-        "period": "Jan 2023 – Dec 2023",
-        "location": "India",
-        "bullets": [
-            "Designed and deployed real-time dashboards using Kibana, Logstash, and Elastic for anomaly detection.",
-            "Performed time-series forecasting and regression modeling, improving system reliability by 15%.",
-            "Optimized SQL pipelines in MySQL and SQL Server, reducing query time by 30%.",
-            "Built automated analytics framework in Python + Playwright, cutting manual reporting by 50%.",
-            "Applied ML models for predictive monitoring and anomaly detection of system health."
-        ],
-        "tech": ["Python", "SQL", "Kibana", "Elastic", "Playwright"],
-    },
-]
-
-# -------------------------
-# CERTIFICATES (new)
-# -------------------------
-CERTIFICATES = [
-    {
-        "title": "Getting Started with Deep Learning",
-        "issuer": "LinkedIn Learning",
-        "date": "Mar 2025",
-        "notes": "Skills: Deep Learning",
-        "file": None  # put path like "assets/cert1.pdf" if you want download button
-    },
-    {
-        "title": "Training Neural Networks in Python",
-        "issuer": "LinkedIn Learning",
-        "date": "Mar 2025",
-        "notes": "Skills: Python · Neural Networks",
-        "file": None
-    },  
-    {
-        "title": "Machine Learning Specialization",
-        "issuer": "DeepLearning.AI",
-        "date": "Oct 2024 (Expired Dec 2024)",
-        "notes": "Foundations of ML (Andrew Ng)",
-        "file": None
-    },
-    {
-        "title": "ChatGPT Prompt Engineering for Developers",
-        "issuer": "DeepLearning.AI",
-        "date": "Aug 2024 (Expired Sep 2024)",
-        "notes": "Skills: Prompt Engineering",
-        "file": None
-    },
-]
-
-PROJECTS = [
-    {
-        "name": "AI-powered SQL Chatbot",
-        "desc": "Streamlit + Mistral LLM (Ollama) chatbot to translate natural language queries into SQL for CSV datasets.",
-        "tech": ["Python", "Streamlit", "Ollama", "Mistral LLM", "DuckDB", "SQL"],
-        "link": "https://github.com/LakshmiManaswini-7/sql-chatbot-streamlit",
-        "image": "sql_chatbot.png",
-    },
-]
-
-EDUCATION = [
-    {
-        "school": "Southeast Missouri State University",
-        "program": "M.S. in Computer and Information Sciences",
-        "period": "Jan 2024 - Dec 2025",
-        "location": "Cape Girardeau, Missouri, United States",
-        "details": "GPA 3.72/4.0 | Coursework: ML, AI, Data Structures, Networks, Software Engineering, Data Analysis",
-    }
-]
-
-RESUME_PDF_PATH = "assets/LakshmiManaswini_Resume.pdf"
+PROFILE_SLUG = st.query_params.get("profile", "")
+try:
+    CONTENT = content.profiles.get(PROFILE_SLUG)
+except KeyError:
+    st.error(f"No portfolio named '{PROFILE_SLUG}' here.")
+    st.stop()
+PROFILE = CONTENT.profile
+FIRST_NAME = PROFILE.name.rsplit(" ", 1)[0]
+CHAT_TOPICS = ("skills, experience, projects, qualifications or visa status" if PROFILE.visa
+               else "skills, experience, projects or qualifications")
+SKILLS = CONTENT.skills
+EXPERIENCE = CONTENT.experience
+CERTIFICATES = CONTENT.certificates
+PROJECTS = CONTENT.projects
+EDUCATION = CONTENT.education
+RESUME_PDF_PATH = CONTENT.resume_pdf_path
+
+# When static serving is on, assets are referenced by content-hashed URLs
+# (cacheable by the browser/CDN) instead of inline base64 data URIs.
+STATIC_ASSETS = st.get_option("server.enableStaticServing")
+
+
+def asset_src(path):
+    return assets.static_url(path) if STATIC_ASSETS else assets.data_uri(path)
+
+
+def html(markup):
+    """st.markdown for trusted HTML, counted towards the current metrics span."""
+    metrics.add_bytes(len(markup))
+    st.markdown(markup, unsafe_allow_html=True)
+
+
+def picture_html(src, alt, css_class="", width=None):
+    """<picture> markup for ``src`` using the pre-built variants when available."""
+    size = f" width='{width}'" if width else ""
+    if not STATIC_ASSETS:
+        # inline mode: one small 2x variant rather than a srcset of data URIs
+        return f"<img src='{asset_src(images.best(src))}' class='{css_class}' alt='{alt}'{size}/>"
+    return images.picture_html(src, alt, assets.static_url, css_class, width)
 
 # -------------------------
 # UI CONFIG
 # -------------------------
-st.set_page_config(page_title=f"{PROFILE['name']} — Portfolio", page_icon="👩‍💻", layout="wide")
-
-st.markdown("""
-<style>
-/* Global typography (increase font size for all text except headings) */
-html, body, [class*="css"]  {
-  font-size: 18px !important;   /* increased */
-  line-height: 1.7;
-}
-
-/* Hero heading */
-h1.hero {
-  font-size: 42px;                 
-  font-weight: 800;
-  letter-spacing: 0.3px;
-  margin-top: 0.25rem;
-  margin-bottom: 0.75rem;
-}
-
-/* Section subheaders */
-h2, .stMarkdown h2 {
-  font-size: 26px !important;
-  font-weight: 700 !important;
-}
-
-/* Tabs look like chunky buttons */
-.stTabs [data-baseweb="tab-list"] {
-  gap: 12px;
-  border-bottom: 2px solid #ddd;
-  padding-bottom: 6px;
-}
-.stTabs [data-baseweb="tab"] {
-  background: #f6f7f9;
-  border: 1px solid #000;       /* black border */
-  border-bottom: 3px solid #000;
-  padding: 10px 16px;
-  border-radius: 14px;
-  color: #111827;
-  font-weight: 600;
-  box-shadow: 0 1px 0 rgba(0,0,0,0.03);
-}
-.stTabs [aria-selected="true"] {
-  background: #000;             /* black bg for active tab */
-  border-color: #000;
-  color: #fff;                  /* white text */
-  border-bottom-color: #000;
-}
-
-/* Sidebar name + role chip */
-.sidebar-name { font-size: 26px; font-weight: 800; margin-bottom: 4px; }
-.role-chip {
-  display:inline-block; padding:6px 10px; border-radius:999px;
-  background:#111827; color:#fff; font-size:14px; font-weight:600;
-}
-
-/* Contact labels spacing */
-.sidebar-contact p { margin: 0.25rem 0 }
-
-/* Manu intro message box */
-.Manu-intro {
-  background: #000;
-  color: #fff;
-  padding: 12px 16px;
-  border-radius: 10px;
-  font-size: 17px;
-  font-weight: 500;
-  margin-top: 10px;
-}
-
-/* Experience card hover styles */
-.exp-card {
-    display: block;
-    width: 100%;
-    border-radius: 14px;
-    overflow: hidden;
-    transition: transform 0.25s ease, box-shadow 0.25s ease;
-    cursor: pointer;
-    margin: 14px 0 22px 0;
-    border: 2px solid #000000;
-    box-shadow: 0 2px 6px rgba(0,0,0,0.06);
-    background-color: #ffffff;
-}
-
-.exp-card:hover {
-    transform: translateY(-6px);
-    box-shadow: 0 12px 24px rgba(0,0,0,0.18);
-}
-
-.exp-left {
-    flex: 1;
-    padding: 18px 14px;
-    background-color: #fef3c7;
-    display: flex;
-    flex-direction: column;
-    justify-content: center;
-    text-align: center;
-}
-
-.exp-right {
-    flex: 2;
-    padding: 18px;
-    background-color: #ffffff;
-}
-
-/* Project card */
-.project-card {
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-    border-radius: 16px;
-    overflow: hidden;
-    padding: 14px;
-    margin-bottom: 28px;
-    background-color: #fff;
-    transition: transform 0.25s ease, box-shadow 0.25s ease;
-}
-
-.project-image {
-    width: 500px;        /* 👈 smaller like profile photo */
-    height: auto;
-    border-radius: 12px;
-    transition: transform 0.25s ease, box-shadow 0.25s ease;
-    cursor: pointer;
-    margin-bottom: 12px;
-    display: block;
-}
-
-.project-image:hover {
-    transform: translateY(-6px) scale(1.03);
-    box-shadow: 0 10px 22px rgba(0,0,0,0.25);
-}
-            /* Certificate card with forced white background + slide-up animation */
-.cert-card {
-    border-radius: 12px !important;
-    padding: 14px 18px !important;
-    margin-bottom: 16px !important;
-    box-shadow: 0 8px 20px rgba(0,0,0,0.06) !important;
-    background: #ffffff !important;         /* force white */
-    color: #111 !important;                 /* force dark text */
-
-    transform: translateY(18px) !important;
-    opacity: 0 !important;
-
-    animation-name: slideUpFade !important;
-    animation-duration: 700ms !important;
-    animation-timing-function: cubic-bezier(.2,.9,.2,1) !important;
-    animation-fill-mode: both !important;
-    will-change: transform, opacity !important;
-    transition: transform 260ms ease, box-shadow 260ms ease !important;
-    cursor: default !important;
-}
-
-/* Hover effect */
-.cert-card:hover {
-    transform: translateY(-8px) scale(1.02) !important;
-    box-shadow: 0 24px 48px rgba(0,0,0,0.14) !important;
-    cursor: pointer !important;
-}
-
-/* Focus for keyboard users */
-.cert-card:focus {
-    outline: 3px solid rgba(34,197,94,0.12) !important;
-}
-
-/* keyframes */
-@keyframes slideUpFade {
-    0%   { transform: translateY(18px); opacity: 0; }
-    60%  { transform: translateY(-6px); opacity: 1; }
-    100% { transform: translateY(0); opacity: 1; }
-}
-
-
-
-</style>
-""", unsafe_allow_html=True)
+st.set_page_config(page_title=f"{PROFILE.name} — Portfolio", page_icon="👩‍💻", layout="wide")
+
+# all CSS (styles/*.css) merged, minified and content-hashed once per process;
+# linked as a cacheable static file when static serving is on
+with metrics.span("css"):
+    html(styles.sheet.html(STATIC_ASSETS))
 
 
 # Sidebar
 # -------------------------
-with st.sidebar:
-    if PROFILE.get("photo_path"):
+with metrics.span("sidebar"), st.sidebar:
+    if PROFILE.photo_path:
         try:
-            st.image(Image.open(PROFILE["photo_path"]), width=180)
+            if STATIC_ASSETS:
+                html(picture_html(PROFILE.photo_path, PROFILE.name, width=180))
+            else:
+                # resized + encoded once per process (2x for high-DPI screens)
+                st.image(assets.thumbnail(images.best(PROFILE.photo_path), 360), width=180)
         except Exception:
             st.info("Add your photo at assets/profile.jpg")
 
-    st.markdown(f"<div class='sidebar-name'>{PROFILE['name']}</div>", unsafe_allow_html=True)
-    st.markdown(f"<span class='role-chip'>{PROFILE['role']}</span>", unsafe_allow_html=True)
+    st.markdown(f"<div class='sidebar-name'>{PROFILE.name}</div>", unsafe_allow_html=True)
+    st.markdown(f"<span class='role-chip'>{PROFILE.role}</span>", unsafe_allow_html=True)
 
     st.markdown("### Contact")
-    st.write(f"**Email:** {PROFILE['email']}")
-    st.write(f"**Phone:** {PROFILE['phone']}")
-    st.write(f"**Location:** {PROFILE['location']}")
+    st.write(f"**Email:** {PROFILE.email}")
+    st.write(f"**Phone:** {PROFILE.phone}")
+    st.write(f"**Location:** {PROFILE.location}")
 
     links = []
-    if PROFILE.get("github"): links.append(f"[GitHub]({PROFILE['github']})")
-    if PROFILE.get("linkedin"): links.append(f"[LinkedIn]({PROFILE['linkedin']})")
+    if PROFILE.github: links.append(f"[GitHub]({PROFILE.github})")
+    if PROFILE.linkedin: links.append(f"[LinkedIn]({PROFILE.linkedin})")
     if links:
         st.markdown("---")
         st.markdown(" • ".join(links))
@@ -341,18 +106,44 @@ with st.sidebar:
 # -------------------------
 # Main hero (card)
 # -------------------------
-st.markdown("<div class='main-content-card'>", unsafe_allow_html=True)
-st.markdown(f"<h1 class='hero'>Hi, I am {PROFILE['name']}!</h1>", unsafe_allow_html=True)
-st.write(PROFILE["about"])
-st.markdown("</div>", unsafe_allow_html=True)
+with metrics.span("hero"):
+    st.markdown("<div class='main-content-card'>", unsafe_allow_html=True)
+    st.markdown(f"<h1 class='hero'>Hi, I am {PROFILE.name}!</h1>", unsafe_allow_html=True)
+    st.write(PROFILE.about)
+    st.markdown("</div>", unsafe_allow_html=True)
 
 # -------------------------
 # Tabs — added Certificates tab before Resume tab
 # -------------------------
+# Lazy tabs: only the selected tab's body runs on a rerun (set
+# PORTFOLIO_LAZY_TABS=0 to render all six every time, as before).
+LAZY_TABS = os.environ.get("PORTFOLIO_LAZY_TABS", "1") != "0"
+DEBUG_PANEL = os.environ.get("PORTFOLIO_DEBUG", "0") == "1"
+TAB_LABELS = ["👤 Education", "🛠️ Skills", "💼 Experience", "📁 Projects", "🏅 Certificates", "📄 Resume"]
+SECTION_TABS = {"skills": TAB_LABELS[1], "experience": TAB_LABELS[2], "projects": TAB_LABELS[3]}
+
+# a skill-search result was clicked: open its tab and highlight the card for
+# this run only, so the outline is gone on the next interaction
+HIGHLIGHT = None
+if "goto" in st.session_state:
+    section, HIGHLIGHT = st.session_state.pop("goto")
+    if LAZY_TABS:
+        st.session_state.tab = SECTION_TABS[section]
+
 education_tab, skills_tab, exp_tab, projects_tab, certificates_tab, resume_tab = st.tabs(
-    ["👤 Education", "🛠️ Skills", "💼 Experience", "📁 Projects", "🏅 Certificates", "📄 Resume"]
+    TAB_LABELS,
+    key="tab" if LAZY_TABS else None,
+    on_change="rerun" if LAZY_TABS else "ignore",
 )
 
+# page-view events (queued, written by a background thread; see portfolio/events.py)
+if "visitor" not in st.session_state:
+    st.session_state.visitor = uuid.uuid4().hex[:12]
+    events.emit("session", session=st.session_state.visitor, profile=PROFILE_SLUG)
+if LAZY_TABS and st.session_state.get("tab") != st.session_state.get("logged_tab"):
+    st.session_state.logged_tab = st.session_state.get("tab")
+    events.emit("tab", session=st.session_state.visitor, profile=PROFILE_SLUG, tab=st.session_state.logged_tab)
+
 # with education_tab:
 #     # tab-panel has its own card via CSS .stTabs [data-baseweb="tab-panel"]
 #     st.subheader("Education")
@@ -360,16 +151,16 @@ education_tab, skills_tab, exp_tab, projects_tab, certificates_tab, resume_tab =
 #         st.write(f"**{edu['school']}** — {edu['program']} ({edu['period']})")
 #         if edu.get("location"): st.location(edu["location"])
 #         if edu.get("details"): st.caption(edu["details"])
-with education_tab:
+def render_education():
     # tab-panel has its own card via CSS .stTabs [data-baseweb="tab-panel"]
     st.subheader("Education")
     for edu in EDUCATION:
-        st.markdown(f"**{edu['school']}** — {edu['program']}")
-        if edu.get("location"):
-            st.markdown(f"📍 *{edu['location']}*")
-        st.markdown(f"📅 *{edu['period']}*")
-        if edu.get("details"):
-            st.caption(edu["details"])
+        st.markdown(f"**{edu.school}** — {edu.program}")
+        if edu.location:
+            st.markdown(f"📍 *{edu.location}*")
+        st.markdown(f"📅 *{edu.period}*")
+        if edu.details:
+            st.caption(edu.details)
         st.markdown("---")  # separator between entries
 
 
@@ -411,165 +202,103 @@ with education_tab:
 #                 unsafe_allow_html=True
 #             )
 #         i += 1
-st.markdown("""
-<style>
-.skill-card {
-    border-radius: 12px;
-    padding: 16px 20px;
-    margin-bottom: 14px;
-    box-shadow: 0 2px 6px rgba(0,0,0,0.1);
-    transition: transform 0.3s ease, box-shadow 0.3s ease;
-    cursor: pointer;
-    display: inline-block;
-    width: 100%;
-    /* keep background color inline */
-    color: #000000 !important;  /* black text */
-    -webkit-text-fill-color: #000000 !important;
-    text-shadow: none !important;
-    mix-blend-mode: normal !important;
-    filter: none !important;
-}
-
-.skill-card, .skill-card * {
-    color: #000000 !important;  /* force black text for all child elements */
-    -webkit-text-fill-color: #000000 !important;
-    mix-blend-mode: normal !important;
-    filter: none !important;
-}
-
-.skill-card:hover {
-    transform: translateY(-5px);
-    box-shadow: 0 8px 18px rgba(0,0,0,0.25);
-}
-
-.skill-card .skill-list {
-    display: inline;
-    white-space: normal;
-    word-break: break-word;
-}
-</style>
-""", unsafe_allow_html=True)
-
-
-with skills_tab:
+
+
+def highlighted(markup, anchor):
+    """Wrap the card the skill search pointed at, so it stands out."""
+    if anchor == HIGHLIGHT:
+        return f"<div class='card-highlight'>{markup}</div>"
+    return markup
+
+
+# typeahead: a fragment, so each typing pause reruns only the search box and
+# its results (prefix trie + trigram index in portfolio/search.py)
+@st.fragment
+def skill_search():
+    query = st.text_input(
+        "Search skills, tools and tech", key="skill_query", type="search", live="200ms",
+        placeholder="e.g. pytorch, sql, forecasting",
+    )
+    if not query:
+        return
+    hits = search.index(CONTENT).suggest(query)
+    if not hits:
+        st.caption("No matching skills.")
+        return
+    for n, hit in enumerate(hits):
+        term_col, links_col = st.columns([2, 5])
+        term_col.markdown(f"**{hit.label}**" + (" *(did you mean?)*" if hit.match == "fuzzy" else ""))
+        with links_col:
+            for section, title, anchor in hit.targets[:4]:
+                if st.button(f"{section.title()}: {title}", key=f"goto-{n}-{anchor}", type="tertiary"):
+                    st.session_state.goto = (section, anchor)
+                    st.rerun()
+
+
+def render_skills():
     st.subheader("Technical Skills")
+    skill_search()
     cols = st.columns(2)
     i = 0
 
-    # pastel color backgrounds
-    skill_colors = ["#fde2e2", "#e0f7fa", "#fff3e0", "#e8f5e9", "#f3e5f5", "#e1f5fe", "#fff9c4", "#ffe0b2"]
-
-    for idx, (category, skills_list) in enumerate(SKILLS.items()):
-        color = skill_colors[idx % len(skill_colors)]
+    # pastel color backgrounds (see cards.SKILL_COLORS); card HTML is cached
+    for idx, group in enumerate(SKILLS):
         with cols[i % 2]:
-            st.markdown(
-                f"""
-                <div class='skill-card' style='background-color:{color}; color:#000000;'>
-                    <strong style='color:#000000'>{category}:</strong>
-                    <span class='skill-list' style='color:#000000'>{', '.join(skills_list)}</span>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+            html(highlighted(cards.skill(group, idx), cards.anchor("skill", group)))
         i += 1
 
 
 
 
 def experience_card(job, left_bg="#fef3c7"):
-    st.markdown(
-        f"""
-        <div class="exp-card">
-          <div style="display:flex; flex-direction:row; align-items:stretch;">
-            <div class="exp-left" style="background-color:{left_bg};">
-              <h4 style="margin:0; font-weight:700; color:#000000;">{job['company']}</h4>
-              <p style="margin:6px 0 2px 0; font-weight:700; color:#000000;">{job['role']}</p>
-              <p style="margin:0; font-size:13px; color:#111111;">{job['period']}</p>
-            </div>
-            <div class="exp-right">
-              <ul style="margin:0; padding-left:20px;">
-                {''.join([f"<li style='margin-bottom:8px; font-size:16px; color:#111111;'>{b}</li>" for b in job['bullets']])}
-              </ul>
-            </div>
-          </div>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    html(highlighted(cards.experience(job, left_bg), cards.anchor("experience", job)))
 
 # inside your exp_tab
-with exp_tab:
+def render_experience():
     st.subheader("Experience")
     for job in EXPERIENCE:
         experience_card(job)
 
-with projects_tab:
+
+def render_projects():
     st.subheader("Featured Projects")
 
     for p in PROJECTS:
-        img_b64 = img_to_base64(f"assets/{p['image']}")
+        # variants come from the build manifest; encodings are cached per process
+        img_html = picture_html(f"assets/{p.image}", p.name, "project-image") if p.image else ""
 
-        st.markdown(
-            f"""
-            <div class="project-card">
-                <a href="{p['link']}" target="_blank">
-                    <img src="data:image/png;base64,{img_b64}" class="project-image" alt="{p['name']}"/>
-                </a>
-                <h4 style="margin:6px 0; font-weight:700; color:#000000;">{p['name']}</h4>
-                <p style="margin:6px 0; font-size:15px; color:#111111;">{p['desc']}</p>
-                <p style="margin:0; font-size:13px; color:#555555;"><i>{", ".join(p['tech'])}</i></p>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        html(highlighted(cards.project(p, img_html), cards.anchor("project", p)))
 # Replace the certificates tab block with this (CSS-free, Streamlit-native rendering)
-with certificates_tab:
+def render_certificates():
     st.subheader("Licenses & Certifications")
     st.write("Certifications and course completions relevant to AI/ML.")
 
     if not CERTIFICATES:
-        st.info("No certificates found. Make sure the CERTIFICATES list is defined.")
+        st.info("No certificates found. Add them under \"certificates\" in content/profile.json.")
     else:
         for idx, cert in enumerate(CERTIFICATES):
-            # dark card inline styling (stronger than theme)
-            card_style = (
-                "background: linear-gradient(180deg,#0f1724,#0b1220);"
-                "color: #fff;"
-                "padding: 20px;"
-                "border-radius: 14px;"
-                "box-shadow: 0 10px 30px rgba(2,6,23,0.55);"
-                "margin-bottom: 18px;"
-                "display: block;"
-            )
-
-            # Build HTML for left (content) column
-            cert_html = f"""
-                <div style="{card_style}">
-                    <div style="display:flex; align-items:flex-start; gap:18px; width:100%;">
-                        <div style="flex:1; min-width:0;">
-                            <div style="font-size:14px; color:#ffd6a5; margin-bottom:6px;">{cert['issuer']} • {cert['date']}</div>
-                            <div style="font-size:20px; font-weight:700; margin-bottom:8px; color:#ffffff;">{cert['title']}</div>
-                            <div style="font-size:15px; color:#e6eef8;">{cert.get('notes','')}</div>
-                        </div>
-                    </div>
-                </div>
-            """
+            # Build HTML for left (content) column (cached per certificate)
+            cert_html = cards.certificate(cert)
 
             # Use columns so download button aligns to the right of the card
             col_left, col_right = st.columns([10, 1], gap="small")
             with col_left:
-                st.markdown(cert_html, unsafe_allow_html=True)
+                html(cert_html)
             with col_right:
-                if cert.get("file"):
+                if cert.file:
                     try:
-                        # show download button (native)
-                        with open(cert["file"], "rb") as f:
-                            st.download_button(
-                                label="⬇️",
-                                data=f,
-                                file_name=cert["file"].split("/")[-1],
-                                key=f"dl_cert_{idx}"
-                            )
+                        if STATIC_ASSETS:
+                            st.link_button("⬇️", assets.static_url(cert.file))
+                            continue
+                        # map up front so a missing file lands in the warning below;
+                        # the download button only copies the bytes when clicked
+                        downloads.mapped(cert.file)
+                        st.download_button(
+                            label="⬇️",
+                            data=downloads.lazy(cert.file),
+                            file_name=cert.file.split("/")[-1],
+                            key=f"dl_cert_{idx}"
+                        )
                     except Exception:
                         st.warning("Certificate file not found at the specified path.")
 
@@ -581,57 +310,127 @@ with certificates_tab:
 #         st.download_button("⬇️ Download my resume", RESUME_PDF_PATH, file_name="LakshmiManaswini_Resume.pdf")
 #     except Exception:
 #         st.info("Place your PDF at assets/LakshmiManaswini_Resume.pdf")
-with resume_tab:
+def render_resume():
     st.subheader("Resume")
     try:
-        if os.path.exists(RESUME_PDF_PATH):
-            with open(RESUME_PDF_PATH, "rb") as f:
-                pdf_bytes = f.read()
+        if os.path.exists(RESUME_PDF_PATH) and STATIC_ASSETS:
+            st.link_button("⬇️ Download my resume", assets.static_url(RESUME_PDF_PATH))
+        elif os.path.exists(RESUME_PDF_PATH):
+            # shared read-only mapping; the PDF is only copied when clicked
             st.download_button(
                 label="⬇️ Download my resume",
-                data=pdf_bytes,
-                file_name="LakshmiManaswini_Resume.pdf",
+                data=downloads.lazy(RESUME_PDF_PATH),
+                file_name=os.path.basename(RESUME_PDF_PATH),
                 mime="application/pdf",
                 key="download_resume"
             )
         else:
-            st.info("Place your PDF at assets/LakshmiManaswini_Resume.pdf")
+            st.info(f"Place your PDF at {RESUME_PDF_PATH}")
     except Exception as e:
         st.error(f"Error preparing resume for download: {e}")
+
+
+for tab, render in (
+    (education_tab, render_education),
+    (skills_tab, render_skills),
+    (exp_tab, render_experience),
+    (projects_tab, render_projects),
+    (certificates_tab, render_certificates),
+    (resume_tab, render_resume),
+):
+    # .open is None when lazy tabs are off, so every tab renders
+    if tab.open is not False:
+        with metrics.span(render.__name__.replace("render_", "tab:")), tab:
+            render()
+
+if HIGHLIGHT:
+    # the card is on the page now; bring it into view
+    st.html(
+        f"<script>setTimeout(() => document.getElementById('{HIGHLIGHT}')"
+        "?.scrollIntoView({behavior: 'smooth', block: 'center'}), 100)</script>",
+        unsafe_allow_javascript=True,
+    )
+
 # -------------------------
 # Chatbot area — black intro card + chat bubbles
 # -------------------------
-st.markdown("<div class='chat-section'>", unsafe_allow_html=True)
-st.subheader("Ask me anything about my profile 🚀")
+# a fragment: sending a question reruns only this function (intro, input and
+# bubbles), not the sidebar, styles and tabs above it
+@st.fragment
+def chat_section():
+    with metrics.span("chat"):
+        st.markdown("<div class='chat-section'>", unsafe_allow_html=True)
+        st.subheader("Ask me anything about my profile 🚀")
 
-st.markdown(
-    "<div class='Manu-intro'>Hi! I'm Manu, Lakshmi Manaswini's AI assistant. "
-    "Ask me anything about her skills, experience, projects, qualifications or visa status! 🚀</div>",
-    unsafe_allow_html=True
-)
-
-# chat input
-user_question = st.chat_input("Type your question here...")
-
-# show conversational bubbles
-if user_question:
-    # show user bubble
-    st.markdown(f"<div class='chat-user'>{user_question}</div>", unsafe_allow_html=True)
-
-    # assistant reply logic (simple rule-based for demo)
-    q = user_question.lower()
-    if "skills" in q:
-        answer = "Key skills: " + ", ".join(sum(SKILLS.values(), []))
-    elif "experience" in q or "work" in q:
-        answer = f"I have {len(EXPERIENCE)} professional role(s) listed, with impact in ML, SQL, and automation."
-    elif "project" in q:
-        answer = f"One highlight is my AI-powered SQL chatbot using Streamlit + Ollama Mistral."
-    elif "visa" in q or "work authorization" in q or "sponsorship" in q:
-        answer = "Currently on an F-1 visa, eligible to work on OPT, and seeking sponsorship after 3 years."
-    else:
-        answer = "Thanks for asking! I’d be happy to chat about my skills, projects, or goals."
+        st.markdown(
+            f"<div class='Manu-intro'>Hi! I'm Manu, {FIRST_NAME}'s AI assistant. Ask me anything about "
+            f"{FIRST_NAME}'s {CHAT_TOPICS}! 🚀</div>",
+            unsafe_allow_html=True
+        )
 
-    # show assistant bubble with black background + white text
-    st.markdown(f"<div class='chat-assistant'>{answer}</div>", unsafe_allow_html=True)
+        # chat input
+        user_question = st.chat_input("Type your question here...")
+
+        # per-session history, capped ring buffer (PORTFOLIO_CHAT_HISTORY messages)
+        if "chat_history" not in st.session_state:
+            st.session_state.chat_history = chat.History()
+        history = st.session_state.chat_history
+
+        if user_question:
+            history.add("user", user_question)
+
+        # show conversational bubbles (assistant: black background + white text)
+        # questions, LLM output and resume excerpts are untrusted (and answers are
+        # shared across sessions by chat.cache), so they are escaped, never raw HTML
+        for role, text in history:
+            html(f"<div class='chat-{role}'>{escape(text)}</div>")
+
+        if user_question:
+            # assistant reply logic: keyword (BM25) + semantic indexes built once per
+            # process, answers cached across sessions by normalized question; the
+            # rest is streamed from the local LLM when OLLAMA_URL is set
+            # backpressure: per-session token bucket + global budget (portfolio/ratelimit.py)
+            started = time.perf_counter()
+            with ratelimit.guard.admit(st.session_state.visitor, st.context.ip_address) as refused:
+                answer = refused or chat.respond(user_question, CONTENT)
+                streamed = not isinstance(answer, str)
+                if streamed:
+                    answer = st.write_stream(answer)
+                else:
+                    html(f"<div class='chat-assistant'>{escape(answer)}</div>")
+            history.add("assistant", answer)
+            events.emit("chat", session=st.session_state.visitor, profile=PROFILE_SLUG, question=user_question,
+                        streamed=streamed, limited=bool(refused), answer_chars=len(answer),
+                        ms=round((time.perf_counter() - started) * 1000, 1))
+
+        st.markdown("</div>", unsafe_allow_html=True)  # close chat-section
+
+
+chat_section()
 
-st.markdown("</div>", unsafe_allow_html=True)  # close chat-section
+# -------------------------
+# Metrics + debug panel (?debug=1 with PORTFOLIO_DEBUG=1)
+# -------------------------
+metrics.register_collector("assets", assets.cache.info)
+metrics.register_collector("cards", cards.cache.info)
+metrics.register_collector("downloads", downloads.info)
+metrics.register_collector("answers", chat.cache.info)
+metrics.register_collector("profiles", content.profiles.info)
+metrics.register_collector("events", events.log.info)
+metrics.register_collector("chat_limits", ratelimit.guard.info)
+if llm.enabled:
+    metrics.register_collector("llm", llm.backend.info)
+metrics.serve()
+
+# the panel shows cache internals and session data, so it needs PORTFOLIO_DEBUG=1
+if DEBUG_PANEL and st.query_params.get("debug") == "1":
+    with st.expander("🔧 Debug metrics", expanded=True):
+        if not metrics.enabled:
+            st.caption("Section timings are off — start the app with PORTFOLIO_METRICS=1.")
+        st.write("**Sections**")
+        st.json(metrics.sections())
+        st.write("**Caches**")
+        st.json(metrics.collected())
+        history = st.session_state.chat_history
+        st.caption(f"This session's chat history: {len(history)} messages, ~{history.footprint()} bytes")
+        st.code(metrics.prometheus(), language="text")
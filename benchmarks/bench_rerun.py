@@ -0,0 +1,186 @@
+# benchmarks/bench_rerun.py — headless rerun benchmark for app.py
+# ----------------------------------------------------
+# Run:  python benchmarks/bench_rerun.py [--repeat 5] [--save-baseline] [--threshold 0.25]
+#
+# Drives app.py with Streamlit's AppTest (no browser, no server) through a
+# cold start, a plain rerun, a view of every tab and a few chat questions,
+# and reports per rerun: wall time, peak RSS, tracemalloc allocations and the
+# bytes of markdown/HTML (and total element protos) the script emitted.
+#
+# --save-baseline writes benchmarks/baseline.json; later runs are compared
+# against it and exit with status 1 if any scenario's median wall time or
+# emitted bytes grew by more than --threshold.
+
+import argparse
+import json
+import logging
+import os
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+TABS = ["👤 Education", "🛠️ Skills", "💼 Experience", "📁 Projects", "🏅 Certificates", "📄 Resume"]
+QUESTIONS = [
+    "what are your skills?",
+    "have you done anomaly detection?",
+    "do you need visa sponsorship?",
+]
+
+
+def _leaves(node):
+    children = getattr(node, "children", None)
+    if children:
+        for child in children.values():
+            yield from _leaves(child)
+    else:
+        yield node
+
+
+def emitted(at):
+    """(markdown/html bytes, total element proto bytes) of the current tree."""
+    html_bytes = proto_bytes = 0
+    for leaf in _leaves(at._tree):
+        proto = getattr(leaf, "proto", None)
+        if proto is not None:
+            proto_bytes += proto.ByteSize()
+        value = getattr(leaf, "value", None)
+        if type(leaf).__name__ in ("Markdown", "Caption", "Html") and isinstance(value, str):
+            html_bytes += len(value.encode())
+    return html_bytes, proto_bytes
+
+
+def peak_rss_kb():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def scenarios():
+    """(name, action) pairs; each action advances one AppTest by one rerun."""
+    steps = [("rerun", lambda at: at.run())]
+    for label in TABS:
+        def view(at, label=label):
+            at.session_state["tab"] = label
+            at.run()
+        steps.append((f"tab:{label.split(' ', 1)[1].lower()}", view))
+    # AppTest reruns the whole script even for a widget inside a fragment, so
+    # chat:* is the full-page cost; in the browser a question reruns only chat_section
+    for q in QUESTIONS:
+        steps.append((f"chat:{q}", lambda at, q=q: at.chat_input[0].set_value(q).run()))
+    return steps
+
+
+def measure(repeat):
+    from streamlit.testing.v1 import AppTest
+
+    # AppTest warns about a missing ScriptRunContext on every run; streamlit
+    # resets logger levels when it loads its config, so filter instead
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(
+        lambda record: "missing ScriptRunContext" not in record.getMessage()
+    )
+
+    def fresh():
+        return AppTest.from_file(APP, default_timeout=60)
+
+    results = {}
+
+    def record(name, at, action, traced):
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        action(at)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        if at.exception:
+            raise RuntimeError(f"{name}: {at.exception[0].message}")
+        traced[name] = {"alloc_peak_kb": peak // 1024, "alloc_retained_kb": current // 1024}
+
+    # timings without tracemalloc (it slows allocation-heavy code down)
+    walls = {}
+    for _ in range(repeat):
+        at = fresh()
+        t0 = time.perf_counter()
+        at.run()
+        walls.setdefault("cold", []).append(time.perf_counter() - t0)
+        for name, action in scenarios():
+            t0 = time.perf_counter()
+            action(at)
+            walls.setdefault(name, []).append(time.perf_counter() - t0)
+
+    # one traced pass for allocations, RSS and emitted bytes
+    traced = {}
+    at = fresh()
+    record("cold", at, lambda a: a.run(), traced)
+    sizes = {"cold": emitted(at)}
+    rss = {"cold": peak_rss_kb()}
+    for name, action in scenarios():
+        record(name, at, action, traced)
+        sizes[name] = emitted(at)
+        rss[name] = peak_rss_kb()
+
+    for name, times in walls.items():
+        results[name] = {
+            "wall_ms_median": round(statistics.median(times) * 1000, 3),
+            "wall_ms_min": round(min(times) * 1000, 3),
+            "peak_rss_kb": rss[name],
+            **traced[name],
+            "html_bytes": sizes[name][0],
+            "proto_bytes": sizes[name][1],
+        }
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, now in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        for metric in ("wall_ms_median", "html_bytes", "proto_bytes"):
+            old, new = before.get(metric), now.get(metric)
+            if old and new > old * (1 + threshold):
+                regressions.append(f"{name}: {metric} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless rerun benchmark for app.py")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative growth")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results only")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)  # app.py resolves assets/ and content/ relative to the cwd
+    sys.path.insert(0, ROOT)
+    results = measure(args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'scenario':<40}{'median ms':>10}{'min ms':>9}{'alloc KB':>10}{'html B':>9}{'proto B':>9}{'rss KB':>9}")
+        for name, r in results.items():
+            print(f"{name:<40}{r['wall_ms_median']:>10.1f}{r['wall_ms_min']:>9.1f}{r['alloc_peak_kb']:>10}"
+                  f"{r['html_bytes']:>9}{r['proto_bytes']:>9}{r['peak_rss_kb']:>9}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# benchmarks/importtime.py — where the cold start spends its import time
+# ----------------------------------------------------
+# Run:  python benchmarks/importtime.py [--top 20] [--module portfolio] [--json]
+#
+# Imports the portfolio modules app.py loads at startup (or any --module)
+# in a fresh interpreter under ``python -X importtime`` and prints the
+# slowest imports by cumulative time, plus the total. Use it to check that heavy dependencies
+# (numpy, PIL, http.server) stay off the startup path.
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def default_modules():
+    """The portfolio modules app.py imports at startup (deploy-time tools excluded)."""
+    with open(os.path.join(ROOT, "app.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:      # top level only: imports inside functions are deferred
+        if isinstance(node, ast.ImportFrom) and node.module == "portfolio":
+            modules += [f"portfolio.{alias.name}" for alias in node.names]
+        elif isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names if alias.name.startswith("portfolio.")]
+    return modules
+
+
+def importtime(modules):
+    """[(cumulative_us, self_us, module)] for one fresh ``import`` of ``modules``."""
+    code = "import " + ", ".join(modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative), int(self_us), name[1:].rstrip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the slowest imports of the portfolio app.")
+    parser.add_argument("--module", action="append", help="module to import (repeatable)")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    modules = args.module or default_modules()
+    rows = importtime(modules)
+    # top-level entries (no indentation) add up to the whole import
+    total_us = sum(c for c, _, name in rows if not name.startswith(" "))
+    top = sorted(rows, key=lambda r: r[0], reverse=True)[:args.top]
+
+    if args.json:
+        print(json.dumps({
+            "modules": modules,
+            "total_ms": total_us / 1000,
+            "top": [{"module": n.strip(), "cumulative_ms": c / 1000, "self_ms": s / 1000} for c, s, n in top],
+            "loaded": sorted({n.strip() for _, _, n in rows}),
+        }, indent=2))
+        return
+
+    print(f"import {', '.join(modules)}: {total_us / 1000:.1f} ms total")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative, self_us, name in top:
+        print(f"{cumulative / 1000:14.1f} {self_us / 1000:9.1f}  {name.strip()}")
+    heavy = [m for m in ("numpy", "PIL", "http.server") if any(n.strip() == m for _, _, n in rows)]
+    if heavy:
+        print(f"\nheavy modules on the import path: {', '.join(heavy)}")
+
+
+if __name__ == "__main__":
+    main()
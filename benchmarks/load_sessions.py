@@ -0,0 +1,176 @@
+# benchmarks/load_sessions.py — concurrent-session load test for app.py
+# ----------------------------------------------------
+# Run:  python benchmarks/load_sessions.py [--sessions 1,4,16,32] [--workers 1] [--steps 20] [--json] [--output load.json]
+#
+# For each session count, a pool of fresh worker processes (so caches and
+# memory start from the same state) opens that many AppTest sessions between
+# them and drives every session through a seeded random mix of reruns, tab
+# switches and chat questions.
+#
+# AppTest creates and tears down a process-wide Runtime on every run, so
+# the sessions in one worker cannot rerun at the same moment. Each worker
+# therefore plays them round-robin, like a server whose visitors all click
+# at once and whose reruns contend for the same GIL. "service" latency is
+# one rerun on its own. "response" latency adds the time spent waiting for
+# the other sessions' reruns in that round.
+#
+# Reported per level: throughput (reruns/s), p50/p95/p99/max of both
+# latencies, resident memory per session and error rate. --output writes
+# the same numbers as JSON for comparing builds.
+
+import argparse
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_rerun import APP, scenarios  # noqa: E402
+
+
+def rss_kb():
+    """Current (not peak) resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def run_worker(sessions, steps, seed):
+    """Drive ``sessions`` AppTests round-robin for ``steps`` reruns each (in a worker process)."""
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    from streamlit.testing.v1 import AppTest
+
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(
+        lambda record: "missing ScriptRunContext" not in record.getMessage()
+    )
+
+    # one throwaway session warms the process-wide caches, so the memory
+    # baseline below holds only what is shared and per-session cost is the rest
+    AppTest.from_file(APP, default_timeout=60).run()
+    baseline_kb = rss_kb()
+
+    actions = scenarios()
+    apps = [AppTest.from_file(APP, default_timeout=60) for _ in sessions]
+    plans = []
+    for i in sessions:
+        rng = random.Random(seed * 100003 + i)
+        plans.append([("cold", lambda a: a.run())] + [rng.choice(actions) for _ in range(steps - 1)])
+
+    service, response, errors = [], [], []
+    started = time.perf_counter()
+    for step in range(steps):
+        round_start = time.perf_counter()
+        for at, plan in zip(apps, plans):
+            name, action = plan[step]
+            t0 = time.perf_counter()
+            try:
+                action(at)
+                failed = at.exception[0].message if at.exception else None
+            except Exception as exc:    # a timeout or crash counts as an error, not a harness failure
+                failed = f"{type(exc).__name__}: {exc}"
+            done = time.perf_counter()
+            service.append(done - t0)
+            response.append(done - round_start)
+            if failed:
+                errors.append(f"{name}: {failed}")
+    return {
+        "wall_s": time.perf_counter() - started,
+        "service": service,
+        "response": response,
+        "errors": errors,
+        "rss_baseline_kb": baseline_kb,
+        "rss_kb": rss_kb(),
+    }
+
+
+def run_level(sessions, workers, steps, seed):
+    workers = max(1, min(workers, sessions))
+    # fresh processes per level: nothing cached or allocated by a previous level
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(run_worker, [range(w, sessions, workers) for w in range(workers)],
+                              [steps] * workers, [seed] * workers))
+
+    service = sorted(x for p in parts for x in p["service"])
+    response = sorted(x for p in parts for x in p["response"])
+    errors = [e for p in parts for e in p["errors"]]
+    wall = max(p["wall_s"] for p in parts)
+    total = len(service)
+    level = {
+        "sessions": sessions,
+        "workers": workers,
+        "reruns": total,
+        "errors": len(errors),
+        "error_rate": len(errors) / total if total else 0.0,
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(total / wall, 2) if wall else 0.0,
+    }
+    for kind, values in (("service", service), ("response", response)):
+        for p in (50, 95, 99):
+            level[f"{kind}_p{p}_ms"] = round(percentile(values, p) * 1000, 2)
+        level[f"{kind}_max_ms"] = round(values[-1] * 1000, 2) if values else 0.0
+    level["rss_kb"] = sum(p["rss_kb"] for p in parts)
+    level["rss_per_session_kb"] = round(sum(p["rss_kb"] - p["rss_baseline_kb"] for p in parts) / sessions, 1)
+    level["sample_errors"] = errors[:5]
+    return level
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--sessions", default="1,4,16,32", help="comma-separated session counts")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes sharing the sessions")
+    parser.add_argument("--steps", type=int, default=20, help="reruns per session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results only")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    levels = [int(n) for n in args.sessions.split(",") if n.strip()]
+    results = []
+    for n in levels:
+        level = run_level(n, args.workers, args.steps, args.seed)
+        results.append(level)
+        if not args.json:
+            print(f"{n:>4} sessions: {level['throughput_rps']:>7.1f} reruns/s  "
+                  f"service p50/p95/p99 {level['service_p50_ms']:.0f}/{level['service_p95_ms']:.0f}/{level['service_p99_ms']:.0f} ms  "
+                  f"response p50/p95/p99 {level['response_p50_ms']:.0f}/{level['response_p95_ms']:.0f}/{level['response_p99_ms']:.0f} ms  "
+                  f"{level['rss_per_session_kb']:>8.1f} KB/session  errors {level['error_rate']:.1%}",
+                  flush=True)
+
+    report = {
+        "app": APP,
+        "workers": args.workers,
+        "steps": args.steps,
+        "seed": args.seed,
+        "python": sys.version.split()[0],
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "levels": results,
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if any(level["errors"] for level in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+# benchmarks/ollama_stub.py — fake Ollama server for trying the streaming chat
+# ----------------------------------------------------
+# Run:  python benchmarks/ollama_stub.py [--port 11434] [--delay 0.05] [--words 40]
+# then: OLLAMA_URL=http://127.0.0.1:11434 streamlit run app.py
+# Check: python benchmarks/ollama_stub.py --check [--clients 8]
+#
+# Answers POST /api/generate like Ollama with stream=true: one NDJSON line
+# per word, --delay seconds apart, then {"done": true}, until Ctrl+C. With
+# --check it instead measures time-to-first-token vs. full-answer latency of
+# portfolio.llm against itself, with --clients concurrent requests, and exits.
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_handler(delay, words):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            if self.path != "/api/generate":
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            question = body.get("prompt", "")
+            text = f"(stub answer to: {question}) " + " ".join(f"word{i}" for i in range(words))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for token in text.split(" "):
+                time.sleep(delay)
+                self._chunk({"model": body.get("model"), "response": token + " ", "done": False})
+            self._chunk({"model": body.get("model"), "response": "", "done": True})
+            self.wfile.write(b"0\r\n\r\n")
+
+        def _chunk(self, message):
+            line = json.dumps(message).encode() + b"\n"
+            self.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+            self.wfile.flush()
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def check(url, clients, concurrency):
+    """Time first token and full answer through portfolio.llm.Backend."""
+    sys.path.insert(0, ROOT)
+    from portfolio import llm
+
+    backend = llm.Backend(url=url, max_concurrent=concurrency, timeout=30)
+
+    def one(i):
+        started = time.monotonic()
+        stream = backend.stream(f"question {i}")
+        if stream is None:
+            return None
+        first = time.monotonic() - started
+        "".join(stream)
+        return first, time.monotonic() - started
+
+    with ThreadPoolExecutor(clients) as pool:
+        results = list(pool.map(one, range(clients)))
+    served = [r for r in results if r]
+    print(f"{clients} clients, {concurrency} slots: {len(served)} streamed, "
+          f"{clients - len(served)} fell back to the rules")
+    if served:
+        firsts = sorted(r[0] for r in served)
+        totals = sorted(r[1] for r in served)
+        print(f"  first token: median {firsts[len(firsts) // 2] * 1000:.0f} ms")
+        print(f"  full answer: median {totals[len(totals) // 2] * 1000:.0f} ms")
+    print(f"  {backend.info()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream fake answers like an Ollama server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds between tokens")
+    parser.add_argument("--words", type=int, default=40)
+    parser.add_argument("--clients", type=int, default=8, help="concurrent requests in the self-check")
+    parser.add_argument("--concurrency", type=int, default=4, help="backend slots in the self-check")
+    parser.add_argument("--check", action="store_true", help="run the latency self-check and exit")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.delay, args.words))
+    url = f"http://{args.host}:{server.server_address[1]}"
+    if not args.check:
+        print(f"serving on {url} (Ctrl+C to stop)")
+        server.serve_forever()
+        return
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    check(url, args.clients, args.concurrency)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
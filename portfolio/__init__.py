@@ -0,0 +1 @@
+# portfolio — helpers behind app.py (asset caching, rendering, chatbot)
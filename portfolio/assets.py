@@ -0,0 +1,230 @@
+# portfolio/assets.py — process-wide cache for files under assets/
+# ----------------------------------------------------
+# Every Streamlit rerun used to re-read and re-encode each project image.
+# Files are now read once per process, identified by their sha256, and the
+# encoded forms (raw bytes, base64, data URIs) live in one LRU bounded by
+# total byte size. A file is only re-read when its mtime or size changes.
+#
+# With static serving enabled, files can instead be published under static/
+# with content-hashed names so browsers and CDNs cache them indefinitely.
+#
+# When the cross-worker store is on (portfolio/shared.py), hashes come from
+# its manifest, raw bytes are read-only mappings of its blobs (not counted
+# against this process's budget) and encodings another worker already made
+# are copied from its blobs instead of being recomputed.
+
+import base64
+import hashlib
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+
+from portfolio import shared
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+TEXT_KINDS = {"b64", "uri"}
+
+# Streamlit serves <app dir>/static/ at app/static/ when
+# server.enableStaticServing is set (see .streamlit/config.toml).
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+STATIC_URL = os.environ.get("PORTFOLIO_STATIC_URL", "app/static/")
+
+
+class AssetCache:
+    """Thread-safe LRU of asset encodings keyed by content hash."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, shared_store=None):
+        self.max_bytes = max_bytes
+        self.shared = shared_store
+        self._lock = threading.Lock()
+        self._stats = {}                # path -> ((mtime_ns, size), sha256)
+        self._entries = OrderedDict()   # (sha256, kind) -> bytes | str
+        self._published = set()         # static file names already on disk
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self._counts = {}               # kind -> [hits, misses]
+
+    # -------------------------
+    # lookups
+    # -------------------------
+    def digest(self, path):
+        """Return the sha256 hex digest of ``path``, re-hashing only if it changed."""
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            known = self._stats.get(path)
+            if known and known[0] == stamp:
+                return known[1]
+        sha = self.shared.lookup(path, stamp) if self.shared else None
+        if sha is None:
+            data = _read(path)
+            sha = hashlib.sha256(data).hexdigest()
+            if self.shared and self.shared.put_blob(sha, "raw", data):
+                self.shared.record(path, stamp, sha)
+                data = self.shared.view(sha, "raw") or data
+            with self._lock:
+                self._put((sha, "raw"), data)
+        with self._lock:
+            self._stats[path] = (stamp, sha)
+        return sha
+
+    def read_bytes(self, path):
+        """File contents: bytes, or a read-only memoryview when the shared store is on."""
+        return self._get(path, "raw", lambda raw: raw)
+
+    def b64(self, path):
+        return self._get(path, "b64", lambda raw: base64.b64encode(raw).decode())
+
+    def data_uri(self, path):
+        mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        return self._get(
+            path, "uri", lambda raw: f"data:{mime};base64,{base64.b64encode(raw).decode()}"
+        )
+
+    def thumbnail(self, path, width):
+        """JPEG bytes of ``path`` resized to ``width`` px, decoded once per process.
+
+        Shared by every session, so the sidebar photo is not re-decoded and
+        re-encoded by Streamlit on each rerun.
+        """
+        return self._get(path, f"thumb{width}", lambda raw: _thumbnail(raw, width))
+
+    def static_name(self, path):
+        """Content-hashed file name, e.g. ``sql_chatbot.3f2a9c1b04de.png``."""
+        stem, ext = os.path.splitext(os.path.basename(path))
+        return f"{stem}.{self.digest(path)[:12]}{ext}"
+
+    def publish(self, path, static_dir=STATIC_DIR):
+        """Copy ``path`` into ``static_dir`` under its hashed name (once) and return the name."""
+        name = self.static_name(path)
+        if name in self._published:
+            return name
+        target = os.path.join(static_dir, name)
+        if not os.path.exists(target):
+            os.makedirs(static_dir, exist_ok=True)
+            # per thread as well as per process: two sessions may publish at once
+            tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(self.read_bytes(path))
+            os.replace(tmp, target)
+        with self._lock:
+            self._published.add(name)
+        return name
+
+    def static_url(self, path):
+        # hashed names never change content, so the URL is safe to cache forever
+        return STATIC_URL + self.publish(path)
+
+    def info(self):
+        with self._lock:
+            kinds = {
+                kind: {"hits": h, "misses": m, "hit_rate": h / (h + m) if h + m else 0.0}
+                for kind, (h, m) in self._counts.items()
+            }
+            return {
+                "shared": self.shared.info() if self.shared else None,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "kinds": kinds,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+            self._entries.clear()
+            self._published.clear()
+            self._size = 0
+
+    # -------------------------
+    # internals
+    # -------------------------
+    def _get(self, path, kind, encode):
+        sha = self.digest(path)
+        key = (sha, kind)
+        with self._lock:
+            counts = self._counts.setdefault(kind, [0, 0])
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                counts[0] += 1
+                return value
+            self.misses += 1
+            counts[1] += 1
+            raw = self._entries.get((sha, "raw"))
+        blob = self.shared.view(sha, kind) if self.shared else None
+        if blob is not None:
+            # another worker already encoded it; raw stays a shared mapping
+            value = blob if kind == "raw" else str(blob, "ascii") if kind in TEXT_KINDS else blob.tobytes()
+            with self._lock:
+                self._put(key, value)
+            return value
+        if raw is None:
+            # raw bytes were evicted (or the file changed under us): re-read
+            raw = _read(path)
+            if hashlib.sha256(raw).hexdigest() != sha:
+                with self._lock:
+                    self._stats.pop(path, None)
+                return self._get(path, kind, encode)
+        value = encode(raw)
+        if self.shared and kind != "raw":
+            self.shared.put_blob(sha, kind, value.encode("ascii") if kind in TEXT_KINDS else value)
+        with self._lock:
+            self._put(key, value)
+        return value
+
+    def _put(self, key, value):
+        # caller holds the lock
+        size = _cost(value)
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= _cost(old)
+        self._entries[key] = value
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= _cost(evicted)
+
+
+def _cost(value):
+    # a memoryview is a mapping of a shared blob: page cache, not this heap
+    return 0 if isinstance(value, memoryview) else len(value)
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _thumbnail(raw, width):
+    from io import BytesIO
+    from PIL import Image, ImageOps
+
+    with Image.open(BytesIO(raw)) as im:
+        if im.width <= width and im.format == "JPEG":
+            return bytes(raw)
+        im = ImageOps.exif_transpose(im).convert("RGB")
+        if im.width > width:
+            im = im.resize((width, round(im.height * width / im.width)), Image.LANCZOS)
+        out = BytesIO()
+        im.save(out, "JPEG", quality=85, optimize=True)
+        return out.getvalue()
+
+
+# one cache per process, shared by every session
+cache = AssetCache(int(os.environ.get("PORTFOLIO_ASSET_CACHE_BYTES", DEFAULT_MAX_BYTES)), shared.store)
+
+digest = cache.digest
+read_bytes = cache.read_bytes
+b64 = cache.b64
+data_uri = cache.data_uri
+publish = cache.publish
+static_url = cache.static_url
+thumbnail = cache.thumbnail
@@ -0,0 +1,163 @@
+# portfolio/cards.py — HTML for experience, skill, project and certificate cards
+# ----------------------------------------------------
+# The card markup is built from static data, so each card's HTML is computed
+# once and cached under the (frozen, hashable) record it was built from.
+# Editing a record changes its key and rebuilds just that card.
+
+import dataclasses
+import hashlib
+import json
+import threading
+import weakref
+from collections import OrderedDict
+
+# pastel skill-card backgrounds; styles.py turns these into .skill-bg-N classes
+SKILL_COLORS = ["#fde2e2", "#e0f7fa", "#fff3e0", "#e8f5e9", "#f3e5f5", "#e1f5fe", "#fff9c4", "#ffe0b2"]
+
+
+class FragmentCache:
+    """LRU of rendered HTML keyed by (card kind, source record)."""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._html = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind, record, render):
+        key = (kind, _key(record))
+        with self._lock:
+            html = self._html.get(key)
+            if html is not None:
+                self._html.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+        html = render()
+        with self._lock:
+            self._html[key] = html
+            while len(self._html) > self.max_entries:
+                self._html.popitem(last=False)
+        return html
+
+    def info(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._html),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+def record_hash(record):
+    """Stable sha1 of a record (dataclasses, dicts, lists, tuples, scalars)."""
+    blob = json.dumps(record, sort_keys=True, default=_plain, ensure_ascii=False)
+    return hashlib.sha1(blob.encode()).hexdigest()
+
+
+def _plain(obj):
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+def _key(record):
+    # frozen records hash and compare by value, so they can be the key as-is
+    try:
+        hash(record)
+        return record
+    except TypeError:
+        return record_hash(record)
+
+
+cache = FragmentCache()
+
+
+# weak keys: an anchor is remembered only while its record is in use
+_anchors = weakref.WeakKeyDictionary()
+_anchors_lock = threading.Lock()
+
+
+def anchor(kind, record):
+    """Stable HTML id of a card, e.g. ``project-3f2a9c1b04``; search results link to it."""
+    with _anchors_lock:
+        found = _anchors.get(record)
+    if found is None:
+        found = record_hash(record)[:10]
+        with _anchors_lock:
+            _anchors[record] = found
+    return f"{kind}-{found}"
+
+
+# -------------------------
+# card templates
+# -------------------------
+def experience(job, left_bg="#fef3c7"):
+    def render():
+        bullets = "".join(f"<li>{b}</li>" for b in job.bullets)
+        # .exp-left already has the default background; only override it
+        left_style = f' style="background-color:{left_bg};"' if left_bg != "#fef3c7" else ""
+        return f"""
+        <div class="exp-card" id="{anchor('experience', job)}">
+          <div class="exp-row">
+            <div class="exp-left"{left_style}>
+              <h4 class="exp-company">{job.company}</h4>
+              <p class="exp-role">{job.role}</p>
+              <p class="exp-period">{job.period}</p>
+            </div>
+            <div class="exp-right">
+              <ul class="exp-bullets">
+                {bullets}
+              </ul>
+            </div>
+          </div>
+        </div>
+        """
+    return cache.get("experience", (job, left_bg), render)
+
+
+def skill(group, idx):
+    shade = idx % len(SKILL_COLORS)
+
+    def render():
+        return f"""
+                <div class='skill-card skill-bg-{shade}' id='{anchor("skill", group)}'>
+                    <strong>{group.category}:</strong>
+                    <span class='skill-list'>{', '.join(group.skills)}</span>
+                </div>
+                """
+    return cache.get("skill", (group, shade), render)
+
+
+def project(p, img_html):
+    def render():
+        return f"""
+            <div class="project-card" id="{anchor('project', p)}">
+                {f'<a href="{p.link}" target="_blank">{img_html}</a>' if img_html else ""}
+                <h4 class="project-title">{p.name}</h4>
+                <p class="project-desc">{p.desc}</p>
+                <p class="project-tech"><i>{", ".join(p.tech)}</i></p>
+            </div>
+            """
+    # the image markup depends on the serving mode and variants, so it is part of the key
+    return cache.get("project", (p, img_html), render)
+
+
+def certificate(cert):
+    def render():
+        # dark card styling lives in styles/cards.css (.cert-dark)
+        return f"""
+                <div class="cert-dark">
+                    <div class="cert-row">
+                        <div class="cert-body">
+                            <div class="cert-meta">{cert.issuer} • {cert.date}</div>
+                            <div class="cert-title">{cert.title}</div>
+                            <div class="cert-notes">{cert.notes}</div>
+                        </div>
+                    </div>
+                </div>
+            """
+    return cache.get("certificate", cert, render)
@@ -0,0 +1,169 @@
+# portfolio/chat.py — how Manu picks an answer
+# ----------------------------------------------------
+# Broad questions ("what are your skills?") get the topic summary from the
+# keyword index. Specific or paraphrased ones ("have you done anomaly
+# detection?") quote the closest passage from the semantic index or from the
+# resume PDF's chunk index, falling back to the best keyword match. Anything
+# still unanswered goes to the local LLM when one is configured
+# (portfolio/llm.py) and is streamed to the page; without one, or when it is
+# busy, Manu gives the canned reply.
+#
+# Answers are cached per normalized question for every session (LRU with a
+# TTL and a byte budget), and each session keeps its chat history in a
+# fixed-size ring buffer so long chats don't grow memory without bound.
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+
+from portfolio import intents, llm
+
+HISTORY_CAP = int(os.environ.get("PORTFOLIO_CHAT_HISTORY", 50))
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize(question):
+    """Cache key form of a question: lowercase, single spaces, no trailing punctuation."""
+    return _SPACE_RE.sub(" ", question.lower()).strip(" ?!.")
+
+
+class AnswerCache:
+    """Thread-safe LRU of answers with a TTL and a total size budget."""
+
+    def __init__(self, max_bytes=1024 * 1024, ttl=3600.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (expires_at, answer)
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return None
+
+    def put(self, key, answer):
+        size = _entry_size(key, answer)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, answer)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def info(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def _drop(self, key):
+        # caller holds the lock
+        _, answer = self._entries.pop(key)
+        self._size -= _entry_size(key, answer)
+
+
+def _entry_size(key, answer):
+    return len(key[1].encode()) + len(answer.encode())
+
+
+cache = AnswerCache()
+
+
+class History:
+    """Per-session chat turns in a ring buffer of at most ``cap`` messages."""
+
+    def __init__(self, cap=HISTORY_CAP):
+        self.messages = deque(maxlen=cap)   # (role, text)
+
+    def add(self, role, text):
+        self.messages.append((role, text))
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def __len__(self):
+        return len(self.messages)
+
+    def footprint(self):
+        """Approximate bytes held by this session's history."""
+        return sys.getsizeof(self.messages) + sum(
+            sys.getsizeof(m) + sys.getsizeof(m[0]) + sys.getsizeof(m[1]) for m in self.messages
+        )
+
+
+def respond(question, content):
+    """A cached or rule-based answer (str), or an iterator of streamed LLM chunks."""
+    index = intents.engine(content)
+    key = (index.key, normalize(question))
+    answer = cache.get(key)
+    if answer is not None:
+        return answer
+    answer = _answer(index, question, content)
+    if answer == intents.FALLBACK_ANSWER and llm.enabled:
+        stream = llm.answer(question, content)
+        if stream is not None:
+            return _cached_stream(key, stream)
+        # the LLM was busy or down: answer from the rules, but don't cache
+        # that, so the question is retried once the backend recovers
+        return answer
+    cache.put(key, answer)
+    return answer
+
+
+def _cached_stream(key, stream):
+    chunks = []
+    while True:
+        try:
+            chunk = next(stream)
+        except StopIteration as stop:
+            complete = stop.value
+            break
+        chunks.append(chunk)
+        yield chunk
+    # only a finished generation is cached; a truncated one is retried next time
+    if complete:
+        cache.put(key, "".join(chunks))
+
+
+def _answer(index, question, content):
+    hits = index.search(question, k=1)
+    top = hits[0] if hits and hits[0][0] >= intents.MIN_SCORE else None
+    if top and top[1] in intents.TOPICS:
+        return top[2]
+
+    # deferred: retrieval pulls in numpy, which only the first specific
+    # question should pay for, not every cold start
+    from portfolio import resume, retrieval
+
+    # the closest profile passage or resume chunk, whichever is nearer
+    candidates = [(sim, p["answer"]) for sim, p in retrieval.retriever(content).search(question, k=1)]
+    from_resume = resume.answer(question, content.resume_pdf_path)
+    if from_resume:
+        candidates.append(from_resume)
+    best = max(candidates, default=None)
+    if best and best[0] >= retrieval.MIN_SIMILARITY:
+        return best[1]
+    return top[2] if top else intents.FALLBACK_ANSWER
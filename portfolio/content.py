@@ -0,0 +1,322 @@
+# portfolio/content.py — profile data model loaded from content/profile.json
+# ----------------------------------------------------
+# Portfolio content lives in JSON instead of module-level dicts in app.py.
+# It is compiled once per process into frozen, slotted dataclasses (tuples
+# instead of lists), which are hashable and compare by value, so the render
+# and chat caches can key on the records themselves.
+#
+# ContentStore watches the file: when it changes the JSON is re-read, the
+# new records are diffed against the old ones, unchanged records keep their
+# existing objects, and only the changed ones miss downstream caches. An edit
+# that fails to load (half-written, invalid JSON) is logged and the last good
+# content keeps being served until the file changes again.
+#
+# Multi-profile hosting: ?profile=<slug> selects content/profiles/<slug>.json.
+# Each profile's store is created on its first request and kept in an LRU of
+# at most PORTFOLIO_MAX_PROFILES active profiles. Records are interned across
+# profiles, so a record shared by several profiles (same school, same
+# certificate) is one object and one entry in the render caches.
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+
+CONTENT_PATH = os.environ.get("PORTFOLIO_CONTENT", "content/profile.json")
+PROFILES_DIR = os.environ.get("PORTFOLIO_PROFILES_DIR", "content/profiles")
+MAX_PROFILES = int(os.environ.get("PORTFOLIO_MAX_PROFILES", 16))
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Profile:
+    name: str
+    role: str
+    email: str = ""
+    phone: str = ""
+    location: str = ""
+    about: str = ""
+    photo_path: str = ""
+    github: str = ""
+    linkedin: str = ""
+    impact: str = ""        # "ML, SQL, and automation": areas the experience summary names
+    visa: str = ""          # work authorization answer; the chatbot has no visa topic without it
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class SkillGroup:
+    category: str
+    skills: tuple
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Job:
+    company: str
+    role: str
+    period: str
+    location: str = ""
+    bullets: tuple = ()
+    tech: tuple = ()
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Certificate:
+    title: str
+    issuer: str
+    date: str
+    notes: str = ""
+    file: str | None = None
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Project:
+    name: str
+    desc: str
+    tech: tuple = ()
+    link: str = ""
+    image: str = ""
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class School:
+    school: str
+    program: str
+    period: str
+    location: str = ""
+    details: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Content:
+    profile: Profile
+    skills: tuple         # of SkillGroup
+    experience: tuple     # of Job
+    certificates: tuple   # of Certificate
+    projects: tuple       # of Project
+    education: tuple      # of School
+    resume_pdf_path: str = ""
+
+
+SECTIONS = {
+    "skills": SkillGroup,
+    "experience": Job,
+    "certificates": Certificate,
+    "projects": Project,
+    "education": School,
+}
+
+
+def _record(cls, raw):
+    known = {f.name for f in fields(cls)}
+    values = {k: tuple(v) if isinstance(v, list) else v for k, v in raw.items() if k in known}
+    return cls(**values)
+
+
+def compile_content(raw):
+    """Build an immutable Content from the parsed JSON document."""
+    return Content(
+        profile=_record(Profile, raw["profile"]),
+        resume_pdf_path=raw.get("resume_pdf_path", ""),
+        **{name: tuple(_record(cls, r) for r in raw.get(name, [])) for name, cls in SECTIONS.items()},
+    )
+
+
+def load(path=CONTENT_PATH):
+    with open(path, encoding="utf-8") as f:
+        return compile_content(json.load(f))
+
+
+def diff(old, new):
+    """{section: (added, removed)} for every section whose records changed."""
+    changes = {}
+    if old.profile != new.profile:
+        changes["profile"] = ((new.profile,), (old.profile,))
+    for name in SECTIONS:
+        before, after = set(getattr(old, name)), set(getattr(new, name))
+        if before != after:
+            changes[name] = (tuple(r for r in getattr(new, name) if r not in before),
+                             tuple(r for r in getattr(old, name) if r not in after))
+    if old.resume_pdf_path != new.resume_pdf_path:
+        changes["resume_pdf_path"] = ((new.resume_pdf_path,), (old.resume_pdf_path,))
+    return changes
+
+
+def _share(old, new):
+    """Reuse the old record objects wherever a record did not change."""
+    replaced = {}
+    for name in SECTIONS:
+        existing = {r: r for r in getattr(old, name)}
+        replaced[name] = tuple(existing.get(r, r) for r in getattr(new, name))
+    profile = old.profile if old.profile == new.profile else new.profile
+    return Content(profile=profile, resume_pdf_path=new.resume_pdf_path, **replaced)
+
+
+# keyed by (type, field values), never by the record itself, so an entry goes
+# away as soon as no profile references its record any more
+_interned = weakref.WeakValueDictionary()
+_intern_lock = threading.Lock()
+MAX_INTERNED = 100_000
+
+
+def _canonical(record):
+    # caller holds _intern_lock
+    key = (type(record), *(getattr(record, f.name) for f in fields(record)))
+    found = _interned.get(key)
+    if found is not None:
+        return found
+    if len(_interned) < MAX_INTERNED:
+        _interned[key] = record
+    return record
+
+
+def intern(content):
+    """Content whose records are the canonical instances shared by every profile."""
+    with _intern_lock:
+        sections = {name: tuple(_canonical(r) for r in getattr(content, name)) for name in SECTIONS}
+        profile = _canonical(content.profile)
+    return Content(profile=profile, resume_pdf_path=content.resume_pdf_path, **sections)
+
+
+class ContentStore:
+    """The current Content for one file, reloaded when the file changes."""
+
+    def __init__(self, path=CONTENT_PATH, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._content = None
+        self._stamp = None
+        self._checked = 0.0
+        self.version = 0
+        self.last_changes = {}
+        self.errors = 0
+        self.last_error = None
+
+    def seed(self, content):
+        """Adopt an already compiled Content (e.g. from the startup snapshot)."""
+        with self._lock:
+            st = os.stat(self.path)
+            self._content, self._stamp = content, (st.st_mtime_ns, st.st_size)
+            self._checked = time.monotonic()
+            self.version += 1
+
+    def get(self):
+        now = time.monotonic()
+        if self._content is not None and now - self._checked < self.check_interval:
+            return self._content
+        with self._lock:
+            self._checked = now
+            stamp = None
+            try:
+                st = os.stat(self.path)
+                stamp = (st.st_mtime_ns, st.st_size)
+                new = intern(load(self.path)) if stamp != self._stamp else None
+            except (OSError, ValueError, KeyError, TypeError) as exc:
+                if self._content is None:
+                    raise
+                # half-written or invalid edit: keep serving the last good content
+                # and don't retry until the file changes again
+                if stamp != self._stamp:
+                    self.errors += 1
+                    self.last_error = f"{type(exc).__name__}: {exc}"
+                    log.warning("keeping previous content, %s failed to load: %s", self.path, self.last_error)
+                    self._stamp = stamp
+                return self._content
+            if new is not None:
+                if self._content is not None:
+                    self.last_changes = diff(self._content, new)
+                    new = _share(self._content, new)
+                self._content, self._stamp = new, stamp
+                self.version += 1
+            return self._content
+
+
+store = ContentStore()
+
+
+class Profiles:
+    """ContentStores per profile slug, loaded on first use, LRU-bounded by count."""
+
+    SLUG_RE = re.compile(r"[a-z0-9][a-z0-9_-]{0,63}")
+
+    def __init__(self, directory=PROFILES_DIR, max_profiles=MAX_PROFILES, default=store):
+        self.directory = directory
+        self.max_profiles = max_profiles
+        self.default = default
+        self._lock = threading.Lock()
+        self._stores = OrderedDict()    # slug -> ContentStore
+        self.loads = 0
+        self.evictions = 0
+
+    def path(self, slug):
+        return os.path.join(self.directory, f"{slug}.json")
+
+    def get(self, slug=None):
+        """Content for ``slug`` (the default profile when empty); KeyError if unknown."""
+        if not slug:
+            return self.default.get()
+        if not self.SLUG_RE.fullmatch(slug) or not os.path.exists(self.path(slug)):
+            raise KeyError(slug)
+        with self._lock:
+            profile_store = self._stores.get(slug)
+            if profile_store is None:
+                profile_store = self._stores[slug] = ContentStore(self.path(slug))
+                self.loads += 1
+                while len(self._stores) > self.max_profiles:
+                    self._stores.popitem(last=False)
+                    self.evictions += 1
+            else:
+                self._stores.move_to_end(slug)
+        return profile_store.get()
+
+    def info(self):
+        with self._lock:
+            return {
+                "active": len(self._stores),
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "interned_records": len(_interned),
+            }
+
+
+profiles = Profiles()
+
+
+class PerContent:
+    """Small LRU of values derived from a Content object, looked up by identity.
+
+    Each entry holds a reference to its Content, so an id() cannot be reused
+    while it is cached; evicting a profile's entries lets both be freed.
+    """
+
+    def __init__(self, max_entries=MAX_PROFILES + 2):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._items = OrderedDict()     # id(content) -> (content, value)
+
+    def get(self, content, build):
+        with self._lock:
+            entry = self._items.get(id(content))
+            if entry is not None and entry[0] is content:
+                self._items.move_to_end(id(content))
+                return entry[1]
+        value = build(content)
+        self.put(content, value)
+        return value
+
+    def put(self, content, value):
+        with self._lock:
+            self._items[id(content)] = (content, value)
+            self._items.move_to_end(id(content))
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def values(self):
+        with self._lock:
+            return [value for _, value in self._items.values()]
@@ -0,0 +1,54 @@
+# portfolio/downloads.py — memory-mapped files behind the download buttons
+# ----------------------------------------------------
+# The resume and certificate buttons used to read the whole file on every
+# rerun of every session, even when nobody downloaded anything. Each file is
+# now mapped read-only once per process and the same buffer is shared by all
+# sessions; bytes are only materialized when a download is actually clicked.
+
+import mmap
+import os
+import threading
+
+
+class MappedFile:
+    """A read-only mmap of one file plus the (mtime, size) it was mapped at."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            self.stamp = (st.st_mtime_ns, st.st_size)
+            # mmap refuses empty files
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else None
+        self.view = memoryview(self._map) if self._map is not None else memoryview(b"")
+
+    def __len__(self):
+        return len(self.view)
+
+
+_lock = threading.Lock()
+_files = {}
+
+
+def mapped(path):
+    """Shared mapping of ``path``; re-mapped only when the file changes on disk."""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _lock:
+        mf = _files.get(path)
+        if mf is None or mf.stamp != stamp:
+            # the old mapping stays valid for anyone still holding it
+            mf = _files[path] = MappedFile(path)
+        return mf
+
+
+def lazy(path):
+    """Callable for ``st.download_button(data=...)`` that copies the bytes on click only."""
+    def load():
+        return bytes(mapped(path).view)
+    return load
+
+
+def info():
+    with _lock:
+        return {"files": len(_files), "mapped_bytes": sum(len(mf) for mf in _files.values())}
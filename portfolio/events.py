@@ -0,0 +1,238 @@
+# portfolio/events.py — batched, append-only log of page views and chat questions
+# ----------------------------------------------------
+# emit() only puts a dict on a bounded in-memory queue, so logging adds no
+# file I/O to a rerun. A background thread drains the queue in batches and
+# appends JSON lines to events/events-<start>-<pid>-<n>.jsonl (one file per
+# worker process at a time). A segment is rotated once it reaches
+# PORTFOLIO_EVENTS_SEGMENT_BYTES or an hour of age, and is then
+# gzip-compressed. When the queue is full (the disk is slower than the
+# visitors), events are dropped and counted rather than blocking the page.
+#
+# Disable with PORTFOLIO_EVENTS=0. Aggregate offline with
+#   python -m portfolio.events [--kind chat] [--top 20]
+
+import argparse
+import atexit
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from collections import Counter
+
+EVENTS_DIR = os.environ.get("PORTFOLIO_EVENTS_DIR", "events")
+enabled = os.environ.get("PORTFOLIO_EVENTS", "1") == "1"
+QUEUE_SIZE = 10_000
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 1.0
+SEGMENT_BYTES = int(os.environ.get("PORTFOLIO_EVENTS_SEGMENT_BYTES", 8 * 1024 * 1024))
+SEGMENT_SECONDS = 3600.0
+
+_STOP = object()
+
+
+class EventLog:
+    """Bounded queue + writer thread producing rotated, gzipped JSONL segments."""
+
+    def __init__(self, directory=EVENTS_DIR, queue_size=QUEUE_SIZE, segment_bytes=SEGMENT_BYTES,
+                 segment_seconds=SEGMENT_SECONDS, flush_interval=FLUSH_INTERVAL):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._file = None
+        self._path = None
+        self._opened = 0.0
+        self._bytes = 0
+        self.emitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.segments = 0
+        self.errors = 0
+
+    def emit(self, kind, **fields):
+        """Queue one event; never blocks (a full queue drops and counts it)."""
+        if self._thread is None:
+            self._start()
+        event = {"ts": round(time.time(), 3), "kind": kind, **fields}
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return
+        with self._lock:
+            self.emitted += 1
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="portfolio-events", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def close(self, timeout=5.0):
+        """Flush what is queued and compress the open segment."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    # -------------------------
+    # writer thread
+    # -------------------------
+    def _run(self):
+        while True:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < BATCH_SIZE:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            if batch:
+                self._write(batch)
+            if self._file is not None and (
+                    stop or self._bytes >= self.segment_bytes
+                    or time.monotonic() - self._opened >= self.segment_seconds):
+                self._rotate()
+            if stop:
+                return
+
+    def _write(self, batch):
+        data = "".join(json.dumps(e, ensure_ascii=False, separators=(",", ":")) + "\n" for e in batch)
+        try:
+            if self._file is None:
+                os.makedirs(self.directory, exist_ok=True)
+                stamp = time.strftime("%Y%m%dT%H%M%S")
+                self._path = os.path.join(self.directory, f"events-{stamp}-{os.getpid()}-{self.segments:05d}.jsonl")
+                self._file = open(self._path, "a", encoding="utf-8")
+                self._opened = time.monotonic()
+                self._bytes = 0
+            self._file.write(data)
+            self._file.flush()
+        except OSError:
+            with self._lock:
+                self.errors += 1
+            return
+        self._bytes += len(data)
+        with self._lock:
+            self.written += len(batch)
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        path = self._path
+        try:
+            with open(path, "rb") as src, gzip.open(path + ".gz.tmp", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(path + ".gz.tmp", path + ".gz")
+            os.remove(path)
+        except OSError:
+            with self._lock:
+                self.errors += 1    # the plain segment stays readable
+        with self._lock:
+            self.segments += 1
+
+    def info(self):
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "emitted": self.emitted,
+                "written": self.written,
+                "dropped": self.dropped,
+                "segments": self.segments,
+                "errors": self.errors,
+            }
+
+
+class _Disabled:
+    def emit(self, kind, **fields):
+        pass
+
+    def close(self, timeout=5.0):
+        pass
+
+    def info(self):
+        return {}
+
+
+log = EventLog() if enabled else _Disabled()
+emit = log.emit
+
+
+# -------------------------
+# reader
+# -------------------------
+def segments(directory=EVENTS_DIR):
+    """Segment paths, oldest first (compressed and still-open ones alike)."""
+    if not os.path.isdir(directory):
+        return []
+    names = [n for n in os.listdir(directory) if n.startswith("events-") and n.endswith((".jsonl", ".jsonl.gz"))]
+    return [os.path.join(directory, n) for n in sorted(names)]
+
+
+def read(directory=EVENTS_DIR, kinds=None, since=None):
+    """Stream events from every segment, one line at a time."""
+    for path in segments(directory):
+        opener = gzip.open if path.endswith(".gz") else open
+        try:
+            with opener(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue    # a line cut short by a crash
+                    if kinds and event.get("kind") not in kinds:
+                        continue
+                    if since and event.get("ts", 0) < since:
+                        continue
+                    yield event
+        except (OSError, EOFError):
+            continue    # segment removed or truncated while reading
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate the portfolio event log.")
+    parser.add_argument("--dir", default=EVENTS_DIR)
+    parser.add_argument("--kind", action="append", help="only these event kinds (repeatable)")
+    parser.add_argument("--hours", type=float, help="only the last N hours")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    since = time.time() - args.hours * 3600 if args.hours else None
+    kinds, sessions, tabs, questions = Counter(), set(), Counter(), Counter()
+    for event in read(args.dir, args.kind, since):
+        kinds[event["kind"]] += 1
+        sessions.add(event.get("session"))
+        if event["kind"] == "tab":
+            tabs[event.get("tab")] += 1
+        elif event["kind"] == "chat":
+            questions[event.get("question", "").strip().lower()] += 1
+
+    print(f"{sum(kinds.values())} events from {len(sessions - {None})} sessions: {dict(kinds)}")
+    if tabs:
+        print("\ntabs opened:")
+        for tab, n in tabs.most_common(args.top):
+            print(f"{n:>7}  {tab}")
+    if questions:
+        print("\ntop questions:")
+        for q, n in questions.most_common(args.top):
+            print(f"{n:>7}  {q}")
+
+
+if __name__ == "__main__":
+    main()
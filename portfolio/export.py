@@ -0,0 +1,194 @@
+# portfolio/export.py — static HTML export of everything except the chatbot
+# ----------------------------------------------------
+# Run:  python -m portfolio.export [--out site] [--chat-url https://...]
+#
+# Education, skills, experience, projects, certificates and the resume are
+# static, so they can be served by any static file server. This renders
+# them from content/profile.json with the same card templates and
+# stylesheet as app.py, copies the optimized image variants and the resume
+# under content-hashed names, and writes .gz (and .br, when the optional
+# `brotli` package is installed) next to every file. The "Manu" chat stays
+# on Streamlit and is linked via --chat-url.
+
+import argparse
+import gzip
+import hashlib
+import html
+import os
+import shutil
+
+from portfolio import cards, content, images, styles
+
+try:
+    import brotli
+except ImportError:     # optional: only .gz files are written without it
+    brotli = None
+
+COMPRESSIBLE = (".html", ".css", ".js", ".json", ".svg", ".txt")
+
+
+class Bundle:
+    """Output directory where every asset gets a content-hashed name."""
+
+    def __init__(self, out):
+        self.out = out
+        self.files = {}     # source path -> relative URL
+
+    def add(self, path, subdir="assets"):
+        if path in self.files:
+            return self.files[path]
+        with open(path, "rb") as f:
+            data = f.read()
+        stem, ext = os.path.splitext(os.path.basename(path))
+        name = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+        self.write(f"{subdir}/{name}", data)
+        self.files[path] = f"{subdir}/{name}"
+        return self.files[path]
+
+    def write(self, rel, data):
+        path = os.path.join(self.out, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data if isinstance(data, bytes) else data.encode("utf-8"))
+        return rel
+
+
+def precompress(out):
+    """Write .gz/.br siblings for text files (images and PDFs are already compressed)."""
+    written = 0
+    for root, _, names in os.walk(out):
+        for name in names:
+            if not name.endswith(COMPRESSIBLE):
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            with open(path + ".gz", "wb") as f:
+                f.write(gzip.compress(data, compresslevel=9, mtime=0))
+            written += 1
+            if brotli is not None:
+                with open(path + ".br", "wb") as f:
+                    f.write(brotli.compress(data, quality=11))
+                written += 1
+    return written
+
+
+def render(c, bundle, chat_url=""):
+    esc = html.escape
+    p = c.profile
+
+    sheet = styles.Stylesheet(files=styles.FILES + ("site.css",))
+    sheet.inline()  # compute css + digest
+    css_url = bundle.write(f"assets/style.{sheet.digest}.css", sheet.css)
+
+    sidebar = []
+    if p.photo_path and os.path.exists(p.photo_path):
+        sidebar.append(images.picture_html(p.photo_path, esc(p.name), bundle.add, width=180))
+    sidebar.append(f"<div class='sidebar-name'>{esc(p.name)}</div>")
+    sidebar.append(f"<span class='role-chip'>{esc(p.role)}</span>")
+    sidebar.append("<h3>Contact</h3><div class='sidebar-contact'>")
+    sidebar.append(f"<p><b>Email:</b> <a href='mailto:{esc(p.email)}'>{esc(p.email)}</a></p>")
+    sidebar.append(f"<p><b>Phone:</b> {esc(p.phone)}</p>")
+    sidebar.append(f"<p><b>Location:</b> {esc(p.location)}</p></div>")
+    links = [f"<a href='{esc(url)}'>{label}</a>" for label, url in (("GitHub", p.github), ("LinkedIn", p.linkedin)) if url]
+    if links:
+        sidebar.append("<hr/>" + " • ".join(links))
+
+    sections = {}
+    sections["education"] = ("👤 Education", "".join(
+        f"<p><b>{esc(e.school)}</b> — {esc(e.program)}</p>"
+        + (f"<p>📍 <i>{esc(e.location)}</i></p>" if e.location else "")
+        + f"<p>📅 <i>{esc(e.period)}</i></p>"
+        + (f"<p><small>{esc(e.details)}</small></p>" if e.details else "")
+        + "<hr/>"
+        for e in c.education
+    ))
+    sections["skills"] = ("🛠️ Skills", "<div class='skill-grid'>" + "".join(
+        cards.skill(g, i) for i, g in enumerate(c.skills)
+    ) + "</div>")
+    sections["experience"] = ("💼 Experience", "".join(cards.experience(job) for job in c.experience))
+    sections["projects"] = ("📁 Projects", "".join(
+        cards.project(proj, images.picture_html(f"assets/{proj.image}", esc(proj.name), bundle.add, "project-image")
+                      if proj.image else "")
+        for proj in c.projects
+    ))
+    certs = []
+    for cert in c.certificates:
+        certs.append(cards.certificate(cert))
+        if cert.file and os.path.exists(cert.file):
+            certs.append(f"<p><a href='{bundle.add(cert.file)}' download>⬇️ {esc(cert.title)}</a></p>")
+    sections["certificates"] = ("🏅 Certificates", "".join(certs))
+    resume = f"<p>Place your PDF at {esc(c.resume_pdf_path or 'assets/resume.pdf')}</p>"
+    if c.resume_pdf_path and os.path.exists(c.resume_pdf_path):
+        resume = (f"<a class='chat-cta' href='{bundle.add(c.resume_pdf_path)}' "
+                  f"download='{esc(os.path.basename(c.resume_pdf_path))}'>⬇️ Download my resume</a>")
+    sections["resume"] = ("📄 Resume", resume)
+
+    nav = "".join(f"<a href='#{key}'>{title}</a>" for key, (title, _) in sections.items())
+    body = "".join(
+        f"<section id='{key}' class='site-section'><h2>{title.split(' ', 1)[1]}</h2>{inner}</section>"
+        for key, (title, inner) in sections.items()
+    )
+    chat = ""
+    first_name = p.name.rsplit(" ", 1)[0]
+    topics = ("skills, experience, projects, qualifications or visa status" if p.visa
+              else "skills, experience, projects or qualifications")
+    if chat_url:
+        chat = (
+            "<section id='chat' class='site-section'><h2>Ask me anything about my profile 🚀</h2>"
+            f"<div class='Manu-intro'>Hi! I'm Manu, {esc(first_name)}'s AI assistant. Ask me anything about "
+            f"{esc(first_name)}'s {topics}! 🚀</div>"
+            f"<a class='chat-cta' href='{esc(chat_url)}'>Chat with Manu</a></section>"
+        )
+
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{esc(p.name)} — Portfolio</title>
+<link rel="stylesheet" href="{css_url}">
+</head>
+<body>
+<div class="site">
+<aside class="site-sidebar">{''.join(sidebar)}</aside>
+<main class="site-main">
+<h1 class="hero">Hi, I am {esc(p.name)}!</h1>
+<p>{esc(p.about)}</p>
+<nav class="site-nav">{nav}</nav>
+{body}
+{chat}
+</main>
+</div>
+</body>
+</html>
+"""
+
+
+def export(out="site", chat_url="", content_path=content.CONTENT_PATH):
+    if os.path.isdir(out) and os.listdir(out):
+        # only ever wipe a previous export, never an arbitrary directory
+        if not os.path.exists(os.path.join(out, "index.html")):
+            raise SystemExit(f"{out}/ is not empty and does not look like a previous export")
+        shutil.rmtree(out)
+    images.build()
+    bundle = Bundle(out)
+    page = render(content.load(content_path), bundle, chat_url)
+    bundle.write("index.html", page)
+    return precompress(out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the portfolio as a static site.")
+    parser.add_argument("--out", default="site")
+    parser.add_argument("--chat-url", default=os.environ.get("PORTFOLIO_CHAT_URL", ""),
+                        help="URL of the Streamlit app hosting the Manu chat")
+    parser.add_argument("--content", default=content.CONTENT_PATH)
+    args = parser.parse_args(argv)
+    compressed = export(args.out, args.chat_url, args.content)
+    total = sum(os.path.getsize(os.path.join(r, n)) for r, _, ns in os.walk(args.out) for n in ns)
+    print(f"wrote {args.out}/ ({total // 1024} KB, {compressed} precompressed files)")
+
+
+if __name__ == "__main__":
+    main()
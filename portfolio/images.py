@@ -0,0 +1,228 @@
+# portfolio/images.py — build-time image variants + manifest
+# ----------------------------------------------------
+# Run at deploy time:  python -m portfolio.images
+#
+# The originals in assets/ are far larger than what the page displays
+# (.project-image is 500px wide, the sidebar photo 180px). This resizes each
+# one to 1x/2x of its display width, strips metadata, re-encodes to
+# WebP/AVIF/JPEG under .cache/images/ and records everything in a manifest.
+# The app reads only the manifest and never decodes the originals.
+
+import hashlib
+import json
+import os
+import sys
+
+CACHE_DIR = ".cache/images"
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.json")
+
+# source image -> displayed CSS width in px (keep in sync with app.py)
+DISPLAY_WIDTHS = {
+    "assets/sql_chatbot.png": 500,   # .project-image { width: 500px }
+    "assets/profile.jpg": 180,       # st.image(..., width=180)
+}
+PHOTO_WIDTH = DISPLAY_WIDTHS["assets/profile.jpg"]
+PROJECT_WIDTH = DISPLAY_WIDTHS["assets/sql_chatbot.png"]
+SCALES = (1, 2)
+QUALITY = {"webp": 80, "avif": 60, "jpeg": 82}
+MIME = {"webp": "image/webp", "avif": "image/avif", "jpeg": "image/jpeg"}
+
+
+def _formats():
+    from PIL import features
+    fmts = ["webp", "jpeg"]
+    if features.check("avif"):
+        fmts.insert(0, "avif")
+    return fmts
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def discover(profiles_dir=None):
+    """DISPLAY_WIDTHS plus the photos and project images of every hosted profile."""
+    from portfolio import content
+
+    sources = dict(DISPLAY_WIDTHS)
+    profiles_dir = profiles_dir or content.PROFILES_DIR
+    if os.path.isdir(profiles_dir):
+        for name in sorted(os.listdir(profiles_dir)):
+            if not name.endswith(".json"):
+                continue
+            try:
+                c = content.load(os.path.join(profiles_dir, name))
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            if c.profile.photo_path:
+                sources.setdefault(c.profile.photo_path, PHOTO_WIDTH)
+            for p in c.projects:
+                if p.image:
+                    sources.setdefault(f"assets/{p.image}", PROJECT_WIDTH)
+    return sources
+
+
+def build(sources=None, cache_dir=CACHE_DIR, force=False):
+    """Build variants for every source whose content changed; return the manifest."""
+    from PIL import Image, ImageOps
+
+    sources = sources or discover()
+    built = {}      # (sha256, display width) -> manifest entry, shared by identical images
+    manifest_path = os.path.join(cache_dir, "manifest.json")
+    old = read_manifest(manifest_path) or {}
+    manifest = {}
+    os.makedirs(cache_dir, exist_ok=True)
+
+    for src, display_width in sources.items():
+        if not os.path.exists(src):
+            continue
+        sha = _sha256(src)
+        prev = old.get(src)
+        if (not force and prev and prev["sha256"] == sha
+                and prev["display_width"] == display_width
+                and all(os.path.exists(v["path"]) for v in prev["variants"])):
+            manifest[src] = prev
+            built.setdefault((sha, display_width), prev)
+            continue
+        if (sha, display_width) in built:
+            # the same picture under another path (e.g. two profiles): reuse its files
+            manifest[src] = built[(sha, display_width)]
+            continue
+
+        with Image.open(src) as im:
+            im = ImageOps.exif_transpose(im)
+            if im.mode in ("RGBA", "LA", "P"):
+                # flatten transparency onto white so JPEG/AVIF match the page
+                im = im.convert("RGBA")
+                bg = Image.new("RGB", im.size, (255, 255, 255))
+                bg.paste(im, mask=im.getchannel("A"))
+                im = bg
+            else:
+                im = im.convert("RGB")
+            orig_w, orig_h = im.size
+
+            stem = os.path.splitext(os.path.basename(src))[0]
+            variants = []
+            widths = set()
+            for scale in SCALES:
+                width = min(display_width * scale, orig_w)
+                if width in widths:
+                    continue    # clamped to the original width: same file as the smaller scale
+                widths.add(width)
+                height = round(orig_h * width / orig_w)
+                resized = im.resize((width, height), Image.LANCZOS) if width != orig_w else im
+                for fmt in _formats():
+                    out = os.path.join(cache_dir, f"{stem}.{sha[:12]}.{width}w.{fmt}")
+                    # a fresh image carries no EXIF/ICC/XMP, so metadata is dropped
+                    resized.save(out, fmt.upper(), quality=QUALITY[fmt], optimize=fmt == "jpeg")
+                    variants.append({
+                        "path": out,
+                        "format": fmt,
+                        "mime": MIME[fmt],
+                        "scale": scale,
+                        "width": width,
+                        "height": height,
+                        "bytes": os.path.getsize(out),
+                    })
+
+        manifest[src] = built[(sha, display_width)] = {
+            "sha256": sha,
+            "display_width": display_width,
+            "width": orig_w,
+            "height": orig_h,
+            "bytes": os.path.getsize(src),
+            "variants": variants,
+        }
+
+    tmp = manifest_path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, manifest_path)
+    return manifest
+
+
+def read_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+_manifest = {"stamp": None, "data": None, "variants": {}}
+
+
+def manifest():
+    """The build manifest, re-read only when the file changes (None if not built)."""
+    try:
+        st = os.stat(MANIFEST_PATH)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+    if _manifest["stamp"] != stamp:
+        _manifest["data"] = read_manifest()
+        _manifest["variants"] = {}
+        _manifest["stamp"] = stamp
+    return _manifest["data"]
+
+
+def _existing(src):
+    # variant files are checked once per manifest version, not on every rerun
+    data = manifest() or {}
+    found = _manifest["variants"].get(src)
+    if found is None:
+        entry = data.get(src)
+        found, seen = [], set()
+        for v in sorted(entry["variants"], key=lambda v: v["scale"]) if entry else ():
+            # older manifests list a clamped width once per scale
+            if (v["format"], v["width"]) not in seen and os.path.exists(v["path"]):
+                seen.add((v["format"], v["width"]))
+                found.append(v)
+        _manifest["variants"][src] = found
+    return found
+
+
+def variants(src, fmt=None):
+    """Variants built for ``src`` (optionally one format), smallest first."""
+    found = _existing(src)
+    if fmt:
+        found = [v for v in found if v["format"] == fmt]
+    return found
+
+
+def best(src, scale=2, fmt="webp"):
+    """Path of the variant closest to ``scale`` in ``fmt``, else the original."""
+    found = variants(src, fmt) or variants(src, "jpeg")
+    for v in reversed(found):
+        if v["scale"] <= scale:
+            return v["path"]
+    return found[0]["path"] if found else src
+
+
+def picture_html(src, alt, url, css_class="", width=None):
+    """<picture> with AVIF/WebP srcsets and a JPEG fallback; ``url(path)`` maps files to URLs."""
+    size = f" width='{width}'" if width else ""
+    sources = []
+    for fmt in ("avif", "webp"):
+        found = variants(src, fmt)
+        if found:
+            srcset = ", ".join(f"{url(v['path'])} {v['scale']}x" for v in found)
+            sources.append(f"<source type='{found[0]['mime']}' srcset='{srcset}'/>")
+    fallback = best(src, scale=1, fmt="jpeg")
+    return (
+        f"<picture>{''.join(sources)}"
+        f"<img src='{url(fallback)}' class='{css_class}' alt='{alt}'{size}/>"
+        f"</picture>"
+    )
+
+
+if __name__ == "__main__":
+    result = build(force="--force" in sys.argv)
+    for src, entry in result.items():
+        print(f"{src}: {entry['bytes'] // 1024} KB, {entry['width']}x{entry['height']}")
+        for v in entry["variants"]:
+            print(f"  {v['format']:<5} {v['scale']}x {v['width']}x{v['height']}  {v['bytes'] // 1024} KB")
@@ -0,0 +1,195 @@
+# portfolio/intents.py — keyword intent engine behind the "Manu" chatbot
+# ----------------------------------------------------
+# Replaces the if/elif substring chain with an inverted index built once per
+# process over the skills, experience, projects, certificates and education.
+# Questions are tokenized, expanded with synonyms and scored with BM25, so a
+# lookup only touches the posting lists of the question's own words.
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from itertools import chain
+
+from portfolio.cards import record_hash
+from portfolio.content import PerContent
+
+K1 = 1.2
+B = 0.75
+MIN_SCORE = 0.5
+
+STOPWORDS = {
+    "a", "about", "an", "and", "any", "are", "as", "at", "be", "can", "could", "did", "do", "does",
+    "for", "from", "have", "has", "her", "how", "i", "in", "is", "it", "me", "my", "of", "on", "or",
+    "she", "tell", "the", "to", "what", "which", "with", "you", "your", "yours",
+    # contraction tails ("what's", "don't", "you've")
+    "s", "t", "d", "ll", "re", "ve",
+}
+
+# question word -> words it should also match
+SYNONYMS = {
+    "work": ["experience"],
+    "job": ["experience"],
+    "employment": ["experience"],
+    "intern": ["experience", "internship"],
+    "internship": ["experience"],
+    "role": ["experience"],
+    "company": ["experience"],
+    "built": ["project"],
+    "portfolio": ["project"],
+    "github": ["project"],
+    "tech": ["skill"],
+    "stack": ["skill"],
+    "tool": ["skill"],
+    "language": ["skill", "programming"],
+    "know": ["skill"],
+    "certificate": ["certification"],
+    "certified": ["certification"],
+    "cert": ["certification"],
+    "course": ["certification", "education"],
+    "license": ["certification"],
+    "degree": ["education"],
+    "study": ["education"],
+    "studied": ["education"],
+    "university": ["education"],
+    "school": ["education"],
+    "gpa": ["education"],
+    "master": ["education"],
+    "qualification": ["education", "certification"],
+    "sponsorship": ["visa"],
+    "sponsor": ["visa"],
+    "authorization": ["visa"],
+    "opt": ["visa"],
+    "h1b": ["visa"],
+    "ml": ["machine", "learning"],
+    "ai": ["artificial", "intelligence"],
+    "dl": ["deep", "learning"],
+    "llm": ["language", "model"],
+}
+
+# kinds of the topic-level summary documents (entity documents use
+# "skill", "job", "project", "certificate" and "school")
+TOPICS = {"skills", "experience", "projects", "certificates", "education", "visa"}
+
+FALLBACK_ANSWER = "Thanks for asking! I’d be happy to chat about my skills, projects, or goals."
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def tokenize(text):
+    """Lowercase word tokens with stopwords dropped and plural 's' stripped."""
+    tokens = []
+    for tok in _TOKEN_RE.findall(text.lower()):
+        if tok in STOPWORDS:
+            continue
+        if len(tok) > 3 and tok.endswith("s") and not tok.endswith("ss"):
+            tok = tok[:-1]
+        tokens.append(tok)
+    return tokens
+
+
+def expand(tokens):
+    return list(chain(tokens, chain.from_iterable(SYNONYMS.get(t, ()) for t in tokens)))
+
+
+class IntentIndex:
+    """BM25 over one document per profile record plus one per topic."""
+
+    key = None  # hash of the data the index was built from (set by engine())
+
+    def __init__(self, docs):
+        # docs: list of (kind, text, answer)
+        self.docs = []
+        self.postings = defaultdict(list)   # token -> [(doc_id, tf)]
+        lengths = []
+        for doc_id, (kind, text, answer) in enumerate(docs):
+            counts = Counter(tokenize(text))
+            for tok, tf in counts.items():
+                self.postings[tok].append((doc_id, tf))
+            lengths.append(sum(counts.values()))
+            self.docs.append((kind, answer))
+        n = len(self.docs)
+        self.avgdl = (sum(lengths) / n) if n else 0.0
+        self.norm = [K1 * (1 - B + B * length / self.avgdl) if self.avgdl else K1 for length in lengths]
+        self.idf = {
+            tok: math.log(1 + (n - len(plist) + 0.5) / (len(plist) + 0.5))
+            for tok, plist in self.postings.items()
+        }
+
+    def search(self, question, k=3):
+        """Top ``k`` (score, kind, answer) for ``question``, best first."""
+        scores = defaultdict(float)
+        for tok in set(expand(tokenize(question))):
+            idf = self.idf.get(tok)
+            if idf is None:
+                continue
+            for doc_id, tf in self.postings[tok]:
+                scores[doc_id] += idf * tf * (K1 + 1) / (tf + self.norm[doc_id])
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(score, *self.docs[doc_id]) for doc_id, score in best]
+
+
+def build_docs(content):
+    skills, experience, projects = content.skills, content.experience, content.projects
+    certificates, education = content.certificates, content.education
+    all_skills = list(chain.from_iterable(g.skills for g in skills))
+    docs = [
+        # topic-level documents: broad questions land on a summary answer
+        ("skills", "skill skills technical abilities expertise",
+         "Key skills: " + ", ".join(all_skills)),
+        ("experience", "experience work professional career history",
+         f"I have {len(experience)} professional role(s) listed"
+         + (f", with impact in {content.profile.impact}." if content.profile.impact else ".")),
+        ("projects", "project projects highlight built side",
+         f"One highlight is my {projects[0].name} — {projects[0].desc}" if projects else FALLBACK_ANSWER),
+        ("certificates", "certification certifications certificates credentials",
+         "Certifications: " + "; ".join(f"{c.title} ({c.issuer})" for c in certificates)),
+        ("education", "education degree academic",
+         "; ".join(f"{e.program} at {e.school} ({e.period})" for e in education)),
+    ]
+    if content.profile.visa:
+        docs.append(("visa", "visa status f-1 opt sponsorship work authorization", content.profile.visa))
+    for g in skills:
+        docs.append(("skill", f"{g.category} {' '.join(g.skills)}", f"{g.category}: {', '.join(g.skills)}"))
+    for job in experience:
+        docs.append((
+            "job",
+            " ".join([job.company, job.role, job.location, *job.bullets, *job.tech]),
+            f"{job.role} at {job.company} ({job.period}): {job.bullets[0] if job.bullets else ''}".rstrip(": "),
+        ))
+    for p in projects:
+        docs.append(("project", " ".join([p.name, p.desc, *p.tech]), f"{p.name}: {p.desc} ({p.link})"))
+    for c in certificates:
+        docs.append(("certificate", " ".join([c.title, c.issuer, c.notes]), f"{c.title} — {c.issuer}, {c.date}"))
+    for e in education:
+        docs.append((
+            "school",
+            " ".join([e.school, e.program, e.location, e.details]),
+            f"{e.program} at {e.school} ({e.period}). {e.details}".strip(),
+        ))
+    return docs
+
+
+_engines = PerContent()
+
+
+def engine(content):
+    """Shared IntentIndex for ``content``, rebuilt only when the content changes."""
+    return _engines.get(content, _build)
+
+
+def _build(content):
+    key = record_hash(content)
+    # a reloaded but unchanged file, or a profile identical to another one,
+    # reuses the index already built for that content hash
+    for index in _engines.values():
+        if index.key == key:
+            return index
+    index = IntentIndex(build_docs(content))
+    index.key = key
+    return index
+
+
+def seed(content, index):
+    """Install a prebuilt index for ``content`` (from the startup snapshot)."""
+    _engines.put(content, index)
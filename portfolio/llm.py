@@ -0,0 +1,191 @@
+# portfolio/llm.py — streaming answers from an Ollama-compatible server
+# ----------------------------------------------------
+# Enable with OLLAMA_URL=http://127.0.0.1:11434 (model: OLLAMA_MODEL, default
+# "mistral"). Questions the keyword/semantic indexes can't answer are sent to
+# POST /api/generate with stream=true, and the NDJSON chunks are yielded as
+# they arrive, so the first words show up long before the full answer.
+#
+# One pooled requests.Session is shared by every session in the process. At
+# most PORTFOLIO_LLM_CONCURRENCY generations run at once; a request that finds
+# no free slot, can't connect, or gets no first token within
+# PORTFOLIO_LLM_TIMEOUT seconds is refused, and chat.py answers from the rules
+# instead. Try it without a model:  python benchmarks/ollama_stub.py
+
+import json
+import os
+import threading
+import time
+
+from portfolio.content import PerContent
+
+OLLAMA_URL = os.environ.get("OLLAMA_URL", "").rstrip("/")
+MODEL = os.environ.get("OLLAMA_MODEL", "mistral")
+MAX_CONCURRENT = int(os.environ.get("PORTFOLIO_LLM_CONCURRENCY", 4))
+TIMEOUT = float(os.environ.get("PORTFOLIO_LLM_TIMEOUT", 30))
+CONNECT_TIMEOUT = 2.0
+MAX_TOKENS = 256
+
+enabled = bool(OLLAMA_URL)
+
+
+class Unavailable(Exception):
+    """The backend could not start an answer (unreachable, error or timeout)."""
+
+
+class Overloaded(Unavailable):
+    """Every generation slot is taken."""
+
+
+class Backend:
+    """Pooled client + concurrency limit for one Ollama-compatible server."""
+
+    def __init__(self, url=OLLAMA_URL, model=MODEL, max_concurrent=MAX_CONCURRENT, timeout=TIMEOUT):
+        self.url = url
+        self.model = model
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._session = None
+        self.in_flight = 0
+        self.requests = 0
+        self.completed = 0
+        self.rejected = 0
+        self.errors = 0
+        self.first_tokens = 0
+        self._first_token_s = 0.0
+        self._total_s = 0.0
+
+    def _client(self):
+        # requests is only imported once the backend is actually used
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    session.mount(self.url, HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrent))
+                    self._session = session
+        return self._session
+
+    def stream(self, prompt, system=""):
+        """Iterator of answer chunks, or None if no answer could be started."""
+        chunks = self._generate(prompt, system)
+        try:
+            first = next(chunks)
+        except (StopIteration, Unavailable):
+            return None
+        return _resume(first, chunks)
+
+    def _generate(self, prompt, system):
+        import requests
+
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise Overloaded
+        with self._lock:
+            self.in_flight += 1
+            self.requests += 1
+        started = time.monotonic()
+        first_token = None
+        complete = False
+        body = {
+            "model": self.model,
+            "prompt": prompt,
+            "system": system,
+            "stream": True,
+            "options": {"num_predict": MAX_TOKENS},
+        }
+        try:
+            with self._client().post(f"{self.url}/api/generate", json=body, stream=True,
+                                     timeout=(CONNECT_TIMEOUT, self.timeout)) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    message = json.loads(line)
+                    text = message.get("response", "")
+                    if text:
+                        if first_token is None:
+                            first_token = time.monotonic() - started
+                        yield text
+                    if message.get("done"):
+                        complete = True
+                        break
+                    if time.monotonic() - started > self.timeout:
+                        break
+        except (requests.RequestException, ValueError) as exc:
+            with self._lock:
+                self.errors += 1
+            if first_token is None:
+                raise Unavailable(str(exc)) from exc
+        finally:
+            self._slots.release()
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += complete
+                if first_token is not None:
+                    self.first_tokens += 1
+                    self._first_token_s += first_token
+                self._total_s += time.monotonic() - started
+        return complete
+
+    def info(self):
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "errors": self.errors,
+                "mean_first_token_s": self._first_token_s / self.first_tokens if self.first_tokens else 0.0,
+                "mean_total_s": self._total_s / self.requests if self.requests else 0.0,
+            }
+
+
+def _resume(first, chunks):
+    # the generator is already running (its slot is held), so dropping this
+    # iterator early still closes it and releases the slot
+    yield first
+    return (yield from chunks)
+
+
+backend = Backend()
+
+
+# -------------------------
+# prompt
+# -------------------------
+_system = PerContent()
+
+
+def system_prompt(content):
+    """Profile facts the model may answer from, built once per content version."""
+    return _system.get(content, _system_prompt)
+
+
+def _system_prompt(content):
+    p = content.profile
+    lines = [
+        f"You are Manu, the assistant on {p.name}'s portfolio site. {p.name} is a {p.role}"
+        f"{f' based in {p.location}' if p.location else ''}.",
+        f"Answer in at most three sentences, in the first person as {p.name}, using only the facts below. "
+        "If the facts don't cover the question, say so and suggest asking about their skills, "
+        "projects or experience.",
+        f"About: {p.about}",
+        "Skills: " + "; ".join(f"{g.category}: {', '.join(g.skills)}" for g in content.skills),
+    ]
+    lines += [f"Experience: {j.role} at {j.company} ({j.period}): {' '.join(j.bullets)}" for j in content.experience]
+    lines += [f"Project: {pr.name}: {pr.desc}" for pr in content.projects]
+    lines += [f"Certificate: {c.title} ({c.issuer}, {c.date})" for c in content.certificates]
+    lines += [f"Education: {s.program}, {s.school} ({s.period})" for s in content.education]
+    return "\n".join(lines)
+
+
+def answer(question, content):
+    """Streamed LLM answer to ``question``, or None when the backend is off or refuses."""
+    if not enabled:
+        return None
+    return backend.stream(question, system_prompt(content))
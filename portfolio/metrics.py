@@ -0,0 +1,173 @@
+# portfolio/metrics.py — per-section timing spans and a Prometheus endpoint
+# ----------------------------------------------------
+# Enable with PORTFOLIO_METRICS=1. Sections of app.py are wrapped in
+# ``metrics.span("sidebar")`` etc., which records durations and the bytes of
+# HTML emitted inside them into an in-process registry. Cache hit counters
+# are pulled from registered collectors only when metrics are exported.
+#
+# When disabled, span() returns a shared no-op context manager, so the cost
+# is one function call per section.
+#
+# Exposed as Prometheus text on http://127.0.0.1:$PORTFOLIO_METRICS_PORT/metrics
+# (default 9464) and in the app's debug panel (?debug=1, only when the app
+# runs with PORTFOLIO_DEBUG=1).
+
+import contextlib
+import os
+import re
+import threading
+import time
+
+enabled = os.environ.get("PORTFOLIO_METRICS", "0") == "1"
+PORT = int(os.environ.get("PORTFOLIO_METRICS_PORT", 9464))
+
+_NOOP = contextlib.nullcontext()
+_local = threading.local()
+_lock = threading.Lock()
+_sections = {}      # name -> [count, total_s, max_s, bytes]
+_collectors = {}    # name -> callable returning {metric: number}
+_NAME_RE = re.compile(r"[^a-zA-Z0-9_]")
+
+
+class _Span:
+    __slots__ = ("name", "start", "bytes")
+
+    def __init__(self, name):
+        self.name = name
+        self.bytes = 0
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        _local.stack.pop()
+        with _lock:
+            stats = _sections.setdefault(self.name, [0, 0.0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            stats[3] += self.bytes
+        return False
+
+
+def span(name):
+    """Context manager timing one section of a rerun (no-op when disabled)."""
+    if not enabled:
+        return _NOOP
+    return _Span(name)
+
+
+def add_bytes(n):
+    """Attribute ``n`` bytes of emitted HTML to the innermost open span."""
+    if enabled:
+        stack = getattr(_local, "stack", None)
+        if stack:
+            stack[-1].bytes += n
+
+
+def register_collector(name, collect):
+    """``collect()`` returns a {metric: number} dict (nested dicts allowed), read at export time."""
+    _collectors[name] = collect
+
+
+def sections():
+    with _lock:
+        return {
+            name: {"count": c, "total_s": t, "max_s": m, "mean_ms": t / c * 1000 if c else 0.0, "bytes": b}
+            for name, (c, t, m, b) in _sections.items()
+        }
+
+
+def _flatten(values, prefix=""):
+    # {"kinds": {"uri": {"hits": 3}}} -> {"kinds_uri_hits": 3}
+    out = {}
+    for key, value in values.items():
+        name = _NAME_RE.sub("_", f"{prefix}{key}")
+        if isinstance(value, dict):
+            out.update(_flatten(value, name + "_"))
+        elif isinstance(value, (int, float)):
+            out[name] = int(value) if isinstance(value, bool) else value
+    return out
+
+
+def collected():
+    out = {}
+    for name, collect in list(_collectors.items()):
+        try:
+            out[name] = _flatten(collect())
+        except Exception:
+            continue
+    return out
+
+
+def prometheus():
+    """All metrics in the Prometheus text exposition format."""
+    lines = [
+        "# HELP portfolio_section_seconds Time spent rendering each section of app.py.",
+        "# TYPE portfolio_section_seconds summary",
+    ]
+    snapshot = sections()
+    for name, s in snapshot.items():
+        lines.append(f'portfolio_section_seconds_count{{section="{name}"}} {s["count"]}')
+        lines.append(f'portfolio_section_seconds_sum{{section="{name}"}} {s["total_s"]:.6f}')
+    lines.append("# HELP portfolio_section_max_seconds Slowest single run of each section.")
+    lines.append("# TYPE portfolio_section_max_seconds gauge")
+    for name, s in snapshot.items():
+        lines.append(f'portfolio_section_max_seconds{{section="{name}"}} {s["max_s"]:.6f}')
+    lines.append("# HELP portfolio_section_bytes_total HTML bytes emitted by each section.")
+    lines.append("# TYPE portfolio_section_bytes_total counter")
+    for name, s in snapshot.items():
+        lines.append(f'portfolio_section_bytes_total{{section="{name}"}} {s["bytes"]}')
+    # one family per metric name, with a sample per cache reporting it
+    families = {}
+    for cache, values in collected().items():
+        for metric, value in values.items():
+            families.setdefault(metric, []).append((cache, value))
+    for metric, samples in sorted(families.items()):
+        lines.append(f"# HELP portfolio_cache_{metric} {metric.replace('_', ' ')} reported by each cache's info().")
+        lines.append(f"# TYPE portfolio_cache_{metric} gauge")
+        for cache, value in samples:
+            lines.append(f'portfolio_cache_{metric}{{cache="{cache}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+_server = {"started": False}
+
+
+def serve(port=PORT, host="127.0.0.1"):
+    """Start the /metrics endpoint once per process (only when enabled)."""
+    if not enabled or _server["started"]:
+        return
+    with _lock:
+        if _server["started"]:
+            return
+        _server["started"] = True
+    # http.server is imported here so a disabled registry never loads it
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    try:
+        httpd = ThreadingHTTPServer((host, port), Handler)
+    except OSError:
+        return  # another worker already owns the port
+    threading.Thread(target=httpd.serve_forever, name="portfolio-metrics", daemon=True).start()
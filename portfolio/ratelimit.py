@@ -0,0 +1,131 @@
+# portfolio/ratelimit.py — backpressure for chat submissions
+# ----------------------------------------------------
+# Every chat question reruns the whole script and may hit the indexes or the
+# LLM, so one client hammering st.chat_input could starve everybody else.
+# Each question must take a token from its session's bucket (and, with
+# PORTFOLIO_RATE_LIMIT_IP=1, from its client IP's bucket, for visitors who
+# open many sessions) and then a slot from a process-wide concurrency budget.
+# A refused question gets the constant SLOW_DOWN_ANSWER instead of running
+# the chat handler.
+#
+# Defaults: a burst of PORTFOLIO_CHAT_BURST=5 questions, refilled at
+# PORTFOLIO_CHAT_RATE=0.5 per second, and PORTFOLIO_CHAT_CONCURRENCY=8
+# questions answered at once per process.
+
+import contextlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+RATE = float(os.environ.get("PORTFOLIO_CHAT_RATE", 0.5))
+BURST = float(os.environ.get("PORTFOLIO_CHAT_BURST", 5))
+CONCURRENCY = int(os.environ.get("PORTFOLIO_CHAT_CONCURRENCY", 8))
+BY_IP = os.environ.get("PORTFOLIO_RATE_LIMIT_IP", "0") == "1"
+MAX_KEYS = 10_000
+
+SLOW_DOWN_ANSWER = "Whoa, that's a lot of questions at once! Give me a few seconds and ask again. 🙂"
+BUSY_ANSWER = "Lots of visitors are chatting with me right now. Please try again in a moment. 🙂"
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, burst, now):
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, rate, burst, now):
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class RateLimiter:
+    """Token buckets per key in an LRU, so idle keys don't accumulate."""
+
+    def __init__(self, rate=RATE, burst=BURST, max_keys=MAX_KEYS):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+        self.allowed = 0
+        self.limited = 0
+
+    def allow(self, key):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.burst, now)
+                while len(self._buckets) > self.max_keys:
+                    # the oldest key has had the longest to refill anyway
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            ok = bucket.take(self.rate, self.burst, now)
+            if ok:
+                self.allowed += 1
+            else:
+                self.limited += 1
+            return ok
+
+    def info(self):
+        with self._lock:
+            return {"keys": len(self._buckets), "allowed": self.allowed, "limited": self.limited}
+
+
+class ChatGuard:
+    """Per-session (and per-IP) buckets plus a global budget of concurrent answers."""
+
+    def __init__(self, rate=RATE, burst=BURST, concurrency=CONCURRENCY, by_ip=BY_IP):
+        self.sessions = RateLimiter(rate, burst)
+        # an IP may front several visitors (NAT, offices), so it gets a larger bucket
+        self.ips = RateLimiter(rate * 4, burst * 4) if by_ip else None
+        self.concurrency = concurrency
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.busy = 0
+
+    @contextlib.contextmanager
+    def admit(self, session, ip=None):
+        """Yield None when the question may be answered, else the reply to show instead."""
+        if not self.sessions.allow(session) or (self.ips and ip and not self.ips.allow(ip)):
+            yield SLOW_DOWN_ANSWER
+            return
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.busy += 1
+            yield BUSY_ANSWER
+            return
+        with self._lock:
+            self.in_flight += 1
+        try:
+            yield None
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    def info(self):
+        sessions = self.sessions.info()
+        ips = self.ips.info() if self.ips else {}
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "concurrency": self.concurrency,
+                "busy": self.busy,
+                "session_keys": sessions["keys"],
+                "session_allowed": sessions["allowed"],
+                "session_limited": sessions["limited"],
+                "ip_keys": ips.get("keys", 0),
+                "ip_limited": ips.get("limited", 0),
+            }
+
+
+guard = ChatGuard()
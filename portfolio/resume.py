@@ -0,0 +1,160 @@
+# portfolio/resume.py — searchable chunks of the resume PDF for Manu
+# ----------------------------------------------------
+# Build at deploy time:  python -m portfolio.resume   (needs: pypdf)
+#
+# The resume PDF was only offered as a download. Here its text is extracted
+# one page at a time (pypdf parses pages lazily, so only the current page is
+# held in memory), split into one chunk per bullet or short paragraph under
+# its section heading, and indexed with the same hashed TF-IDF as
+# retrieval.py. The index is written to .cache/resume/ under the PDF's sha256
+# and memory-mapped at startup. It is rebuilt only when the hash changes.
+# The app only loads the index; until the deploy step (this module or
+# portfolio.snapshot) has built it for the current PDF, there are no resume
+# answers.
+
+import os
+import re
+import sys
+import threading
+
+from portfolio import assets, retrieval
+
+CACHE_DIR = os.path.join(".cache", "resume")
+CHUNK_CHARS = 400
+MIN_CHUNK_CHARS = 40
+VERSION = 1
+
+_SPACE_RE = re.compile(r"\s+")
+_BULLETS = ("•", "●", "▪", "◦", "-", "*")
+
+
+def pages(path):
+    """Yield (page number, text) one page at a time."""
+    from pypdf import PdfReader
+
+    with open(path, "rb") as f:
+        reader = PdfReader(f)
+        for number, page in enumerate(reader.pages, 1):
+            yield number, page.extract_text() or ""
+
+
+def chunks(numbered_pages):
+    """Split page texts into {"page", "section", "text"} chunks."""
+    section = ""
+    for number, text in numbered_pages:
+        current = []
+
+        def flush():
+            body = _join(current)
+            current.clear()
+            if len(body) >= MIN_CHUNK_CHARS:
+                return {"page": number, "section": section, "text": body}
+            return None
+
+        for raw in text.splitlines():
+            line = _SPACE_RE.sub(" ", raw).strip()
+            if not line:
+                continue
+            if line.isupper() and len(line) < 60:
+                # a heading like "TECHNICAL SKILLS" starts a new section
+                chunk = flush()
+                if chunk:
+                    yield chunk
+                section = line.title()
+                continue
+            if line.startswith(_BULLETS) or sum(map(len, current)) + len(line) > CHUNK_CHARS:
+                chunk = flush()
+                if chunk:
+                    yield chunk
+                line = line.lstrip("".join(_BULLETS) + " ")
+            current.append(line)
+        chunk = flush()
+        if chunk:
+            yield chunk
+
+
+def _join(lines):
+    # wrapped lines ending in a hyphen ("Scikit-" / "learn") are glued back together
+    out = ""
+    for line in lines:
+        out += line if out.endswith("-") or not out else " " + line
+    return out
+
+
+def build_passages(path):
+    return [
+        {
+            "kind": "resume",
+            "text": f"{c['section']} {c['text']}",
+            "answer": f"From my resume: {c['text']}",
+            "page": c["page"],
+        }
+        for c in chunks(pages(path))
+    ]
+
+
+def _base(sha, cache_dir):
+    return os.path.join(cache_dir, f"{sha[:16]}.v{VERSION}")
+
+
+def build(path, cache_dir=CACHE_DIR, force=False):
+    """Index ``path`` unless an index for its current sha256 exists; return the Retriever."""
+    base = _base(assets.digest(path), cache_dir)
+    if not force:
+        try:
+            return retrieval.Retriever.load(base)
+        except (OSError, ValueError, EOFError):
+            pass
+    index = retrieval.Retriever.build(build_passages(path))
+    try:
+        index.save(base)
+        index = retrieval.Retriever.load(base)
+    except OSError:
+        pass    # read-only disk: keep the in-memory matrix
+    return index
+
+
+_lock = threading.Lock()
+_indexes = {}   # pdf path -> (sha256, Retriever)
+
+
+def index(path, cache_dir=CACHE_DIR):
+    """Shared resume index for ``path``, or None (no PDF, or not built yet).
+
+    Only loads: parsing the PDF is left to the deploy step (python -m
+    portfolio.resume or portfolio.snapshot), never done inside a chat request.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    sha = assets.digest(path)
+    with _lock:
+        known = _indexes.get(path)
+    if known and known[0] == sha:
+        return known[1]
+    try:
+        value = retrieval.Retriever.load(_base(sha, cache_dir))
+    except (OSError, ValueError, EOFError):
+        return None     # retried on the next question, so a later build is picked up
+    with _lock:
+        known = _indexes.get(path)
+        if known and known[0] == sha:
+            return known[1]     # another session loaded it first
+        _indexes[path] = (sha, value)
+    return value
+
+
+def answer(question, path):
+    """(similarity, answer) of the best resume chunk, or None."""
+    found = index(path)
+    hits = found.search(question, k=1) if found is not None else []
+    return (hits[0][0], hits[0][1]["answer"]) if hits else None
+
+
+if __name__ == "__main__":
+    from portfolio import content
+
+    pdf = sys.argv[1] if len(sys.argv) > 1 else content.store.get().resume_pdf_path
+    result = build(pdf, force="--force" in sys.argv)
+    print(f"{pdf}: {len(result.passages)} chunks -> {_base(assets.digest(pdf), CACHE_DIR)}.*")
+    for p in result.passages[:5]:
+        print(f"  p{p['page']} {p['text'][:90]}")
@@ -0,0 +1,176 @@
+# portfolio/retrieval.py — offline semantic search over profile passages
+# ----------------------------------------------------
+# Lets Manu answer paraphrased questions ("have you done anomaly detection?")
+# by quoting the closest experience bullet, project description or
+# certificate note. Passages become hashed TF-IDF vectors (word unigrams +
+# character trigrams, so "anomalies" still meets "anomaly") in one float32
+# matrix. The matrix is saved under .cache/retrieval/ and memory-mapped on
+# later starts; a query is a single matrix-vector product. No network needed.
+
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+
+import numpy as np
+
+from portfolio.cards import record_hash
+from portfolio.content import PerContent
+
+DIM = 1 << 12
+CACHE_DIR = ".cache/retrieval"
+MIN_SIMILARITY = 0.25
+VERSION = 1
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def _features(text):
+    words = _WORD_RE.findall(text.lower())
+    feats = list(words)
+    for w in words:
+        padded = f" {w} "
+        feats.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return feats
+
+
+def _bucket(feature):
+    # crc32 is stable across processes, unlike hash()
+    return zlib.crc32(feature.encode()) & (DIM - 1)
+
+
+def _counts(text):
+    vec = np.zeros(DIM, dtype=np.float32)
+    for feat in _features(text):
+        vec[_bucket(feat)] += 1.0
+    return vec
+
+
+def _normalize(matrix):
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class Retriever:
+    """Cosine top-k over a (passages x DIM) float32 matrix."""
+
+    def __init__(self, matrix, idf, passages):
+        self.matrix = matrix        # may be a read-only np.memmap
+        self.idf = idf
+        self.passages = passages    # list of {"kind", "text", "answer"}
+        self.key = None
+
+    @classmethod
+    def build(cls, passages):
+        counts = np.stack([_counts(p["text"]) for p in passages]) if passages else np.zeros((0, DIM), np.float32)
+        df = (counts > 0).sum(axis=0)
+        idf = (np.log((1 + len(passages)) / (1 + df)) + 1).astype(np.float32)
+        matrix = _normalize(np.log1p(counts) * idf).astype(np.float32)
+        return cls(matrix, idf, passages)
+
+    def vectorize(self, questions):
+        q = np.stack([_counts(text) for text in questions])
+        return _normalize(np.log1p(q) * self.idf).astype(np.float32)
+
+    def search_many(self, questions, k=3):
+        """For each question, up to ``k`` (similarity, passage) pairs, best first."""
+        if not len(self.passages):
+            return [[] for _ in questions]
+        sims = self.vectorize(questions) @ self.matrix.T
+        k = min(k, sims.shape[1])
+        results = []
+        for row in sims:
+            top = np.argpartition(-row, k - 1)[:k]
+            top = top[np.argsort(-row[top])]
+            results.append([(float(row[i]), self.passages[i]) for i in top])
+        return results
+
+    def search(self, question, k=3):
+        return self.search_many([question], k)[0]
+
+    # -------------------------
+    # persistence
+    # -------------------------
+    def save(self, base):
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        for suffix, array in ((".matrix.npy", self.matrix), (".idf.npy", self.idf)):
+            tmp = f"{base}{suffix}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp, base + suffix)
+        tmp = f"{base}.json.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"version": VERSION, "dim": DIM, "passages": self.passages}, f)
+        # the json is written last, so its presence means the arrays are complete
+        os.replace(tmp, base + ".json")
+
+    @classmethod
+    def load(cls, base):
+        with open(base + ".json") as f:
+            meta = json.load(f)
+        if meta.get("version") != VERSION or meta.get("dim") != DIM:
+            raise ValueError("stale retrieval index")
+        matrix = np.load(base + ".matrix.npy", mmap_mode="r")
+        idf = np.load(base + ".idf.npy")
+        return cls(matrix, idf, meta["passages"])
+
+
+def build_passages(content):
+    passages = []
+    for job in content.experience:
+        for bullet in job.bullets:
+            passages.append({
+                "kind": "experience",
+                "text": f"{bullet} {' '.join(job.tech)}",
+                "answer": f"Yes — as {job.role} at {job.company}: {bullet}",
+            })
+    for p in content.projects:
+        passages.append({
+            "kind": "project",
+            "text": f"{p.name} {p.desc} {' '.join(p.tech)}",
+            "answer": f"Yes — my project {p.name}: {p.desc}",
+        })
+    for c in content.certificates:
+        passages.append({
+            "kind": "certificate",
+            "text": f"{c.title} {c.notes}",
+            "answer": f"I completed {c.title} ({c.issuer}, {c.date}). {c.notes}".strip(),
+        })
+    return passages
+
+
+_retrievers = PerContent()
+_build_lock = threading.Lock()
+
+
+def retriever(content, cache_dir=CACHE_DIR):
+    """Shared Retriever for ``content``: memory-mapped from disk, built on first use."""
+    return _retrievers.get(content, lambda c: _load_or_build(c, cache_dir))
+
+
+def _load_or_build(content, cache_dir):
+    passages = build_passages(content)
+    key = hashlib.sha1(f"{VERSION}:{DIM}:{record_hash(passages)}".encode()).hexdigest()[:16]
+    # one builder at a time: sessions asking their first question together
+    # would otherwise build the same index and read each other's files
+    with _build_lock:
+        # profiles with the same passages share one matrix
+        for value in _retrievers.values():
+            if value.key == key:
+                return value
+        base = os.path.join(cache_dir, key)
+        try:
+            value = Retriever.load(base)
+        except (OSError, ValueError, EOFError):
+            value = Retriever.build(passages)
+            try:
+                value.save(base)
+                value = Retriever.load(base)
+            except OSError:
+                pass    # read-only disk: keep the in-memory matrix
+        value.key = key
+        _retrievers.put(content, value)
+        return value
@@ -0,0 +1,148 @@
+# portfolio/search.py — typeahead over skills, experience tech and project tech
+# ----------------------------------------------------
+# Every skill, skill category, job tech stack entry, project tech entry and
+# project name becomes a term pointing at the cards it appears on. Terms go
+# into a character trie, keyed from each word start ("forest" finds "Random
+# Forest"), and every trie node stores its best K term ids at build time, so
+# a completion walks len(prefix) nodes and does no scanning. When the prefix
+# finds fewer than K terms, a trigram index fills the rest with fuzzy matches
+# ("pytroch" -> "PyTorch"). Built once per content version.
+
+import re
+
+from portfolio.cards import anchor
+from portfolio.content import PerContent
+
+K = 8
+MIN_FUZZY = 0.35
+MAX_QUERY = 48
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def normalize(text):
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+def _grams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class Hit:
+    __slots__ = ("label", "targets", "score", "match")
+
+    def __init__(self, label, targets, score, match):
+        self.label = label
+        self.targets = targets      # ((section, title, anchor), ...)
+        self.score = score
+        self.match = match          # "prefix" | "fuzzy"
+
+    def __repr__(self):
+        return f"Hit({self.label!r}, {self.match}, {self.score:.2f})"
+
+
+class TypeaheadIndex:
+    """Prefix trie with per-node top-K lists plus a trigram index for typos."""
+
+    def __init__(self, entries, k=K):
+        # entries: (term label, (section, title, anchor)); merge by normalized term
+        merged = {}
+        for label, target in entries:
+            norm = normalize(label)
+            if not norm:
+                continue
+            term = merged.setdefault(norm, [label, []])
+            if target not in term[1]:
+                term[1].append(target)
+        # rank: terms on more cards first, then alphabetically
+        ordered = sorted(merged.items(), key=lambda kv: (-len(kv[1][1]), kv[0]))
+        self.k = k
+        self.norms = [norm for norm, _ in ordered]
+        self.labels = [label for _, (label, _) in ordered]
+        self.targets = [tuple(targets) for _, (_, targets) in ordered]
+
+        self._root = ({}, [])   # node: (children by char, top term ids)
+        self._grams = {}        # trigram -> [term ids]
+        for tid, norm in enumerate(self.norms):
+            starts = [0] + [i + 1 for i, ch in enumerate(norm) if ch == " "]
+            for start in starts:
+                self._insert(norm[start:], tid)
+            for gram in _grams(norm):
+                self._grams.setdefault(gram, []).append(tid)
+        self._gram_counts = [len(_grams(norm)) for norm in self.norms]
+
+    def _insert(self, key, tid):
+        node = self._root
+        for ch in key:
+            node = node[0].setdefault(ch, ({}, []))
+            # ids arrive in rank order, so the first K kept are the best K
+            if len(node[1]) < self.k and tid not in node[1]:
+                node[1].append(tid)
+
+    def __len__(self):
+        return len(self.norms)
+
+    def complete(self, prefix):
+        """Term ids whose normalized text has a word starting with ``prefix``, best first."""
+        node = self._root
+        for ch in prefix:
+            node = node[0].get(ch)
+            if node is None:
+                return []
+        return node[1]
+
+    def fuzzy(self, query, k=K, exclude=()):
+        """(score, id) of terms sharing the most trigrams with ``query`` (Dice coefficient)."""
+        grams = _grams(query)
+        shared = {}
+        for gram in grams:
+            for tid in self._grams.get(gram, ()):
+                shared[tid] = shared.get(tid, 0) + 1
+        scored = []
+        for tid, n in shared.items():
+            if tid in exclude:
+                continue
+            score = 2 * n / (len(grams) + self._gram_counts[tid])
+            if score >= MIN_FUZZY:
+                scored.append((score, tid))
+        scored.sort(key=lambda s: (-s[0], s[1]))
+        return scored[:k]
+
+    def suggest(self, query, k=None):
+        k = k or self.k     # nodes keep only self.k ids, so a larger k only adds fuzzy hits
+        q = normalize(query[:MAX_QUERY])
+        if not q:
+            return []
+        ids = self.complete(q)[:k]
+        hits = [Hit(self.labels[t], self.targets[t], 1.0, "prefix") for t in ids]
+        if len(hits) < k:
+            for score, t in self.fuzzy(q, k - len(hits), exclude=set(ids)):
+                hits.append(Hit(self.labels[t], self.targets[t], score, "fuzzy"))
+        return hits
+
+
+def entries(content):
+    """(term, (section, title, anchor)) for every searchable term in ``content``."""
+    for group in content.skills:
+        target = ("skills", group.category, anchor("skill", group))
+        yield group.category, target
+        for skill in group.skills:
+            yield skill, target
+    for job in content.experience:
+        target = ("experience", f"{job.role} at {job.company}", anchor("experience", job))
+        for tech in job.tech:
+            yield tech, target
+    for p in content.projects:
+        target = ("projects", p.name, anchor("project", p))
+        yield p.name, target
+        for tech in p.tech:
+            yield tech, target
+
+
+_indexes = PerContent()
+
+
+def index(content):
+    """Shared TypeaheadIndex for ``content``, built on first use."""
+    return _indexes.get(content, lambda c: TypeaheadIndex(entries(c)))
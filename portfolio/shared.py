@@ -0,0 +1,210 @@
+# portfolio/shared.py — asset blobs shared by every worker process
+# ----------------------------------------------------
+# Warm once at deploy time:  python -m portfolio.shared
+#
+# With several Streamlit workers behind a load balancer, each one used to
+# hash, read and encode the same images into its own heap. Encoded forms now
+# go to content-addressed files under .cache/shared/ (<sha256>.<kind>, e.g.
+# ….raw, ….thumb360, ….uri) that every worker maps read-only, so the bytes
+# live once in the OS page cache instead of once per process.
+#
+# Blobs are immutable: a name always holds the same bytes, and a blob is
+# written to a temp file and renamed into place, so a reader sees it whole or
+# not at all. manifest.json maps source paths (at a given mtime/size) to
+# their sha256 and carries a version number. Writers take an flock and
+# replace it atomically, and readers re-stat it at most once a second.
+# Whichever worker meets a file first publishes it; the rest attach.
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+from portfolio.downloads import MappedFile
+
+try:
+    import fcntl
+except ImportError:     # Windows: writers are not serialized, replaces stay atomic
+    fcntl = None
+
+SHARED_DIR = os.environ.get("PORTFOLIO_SHARED_DIR", os.path.join(".cache", "shared"))
+enabled = os.environ.get("PORTFOLIO_SHARED_ASSETS", "1") == "1"
+
+
+@contextlib.contextmanager
+def _exclusive(path):
+    with open(path, "a") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class SharedStore:
+    """Versioned manifest + read-only mappings of content-addressed blobs."""
+
+    def __init__(self, directory=SHARED_DIR, check_interval=1.0):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._manifest = {"version": 0, "files": {}}
+        self._stamp = None
+        self._checked = 0.0
+        self._maps = {}     # blob name -> MappedFile
+        self.published = 0
+
+    # -------------------------
+    # reading
+    # -------------------------
+    def _current(self, force=False):
+        # caller holds the lock
+        now = time.monotonic()
+        if not force and now - self._checked < self.check_interval:
+            return self._manifest
+        self._checked = now
+        try:
+            st = os.stat(self.manifest_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            if stamp != self._stamp:
+                with open(self.manifest_path) as f:
+                    self._manifest = json.load(f)
+                self._stamp = stamp
+        except (OSError, ValueError):
+            pass    # missing or mid-replace on a non-POSIX disk: keep what we had
+        return self._manifest
+
+    @property
+    def version(self):
+        with self._lock:
+            return self._current().get("version", 0)
+
+    def lookup(self, path, stamp):
+        """sha256 some worker recorded for ``path`` at ``stamp`` (mtime_ns, size), else None."""
+        with self._lock:
+            entry = self._current()["files"].get(path)
+        if entry and tuple(entry["stamp"]) == tuple(stamp):
+            return entry["sha256"]
+        return None
+
+    def view(self, sha, kind):
+        """Read-only memoryview of blob ``<sha>.<kind>``, mapped once per process; None if absent."""
+        name = f"{sha}.{kind}"
+        with self._lock:
+            mf = self._maps.get(name)
+        if mf is None:
+            try:
+                mf = MappedFile(os.path.join(self.directory, name))
+            except OSError:
+                return None
+            with self._lock:
+                mf = self._maps.setdefault(name, mf)
+        return mf.view
+
+    # -------------------------
+    # writing
+    # -------------------------
+    def put_blob(self, sha, kind, data):
+        """Write a blob unless it exists; returns False on a read-only disk."""
+        target = os.path.join(self.directory, f"{sha}.{kind}")
+        if os.path.exists(target):
+            return True
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, target)
+        except OSError:
+            return False
+        with self._lock:
+            self.published += 1
+        return True
+
+    def record(self, path, stamp, sha):
+        """Map ``path`` at ``stamp`` to ``sha`` in a new manifest version."""
+        entry = {"stamp": list(stamp), "sha256": sha}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with _exclusive(os.path.join(self.directory, ".lock")), self._lock:
+                manifest = self._current(force=True)
+                if manifest["files"].get(path) == entry:
+                    return
+                new = {"version": manifest.get("version", 0) + 1, "files": {**manifest["files"], path: entry}}
+                tmp = f"{self.manifest_path}.{os.getpid()}.tmp"
+                with open(tmp, "w") as f:
+                    json.dump(new, f, indent=1)
+                os.replace(tmp, self.manifest_path)
+                self._manifest, self._stamp = new, None
+        except OSError:
+            pass
+
+    def prune(self):
+        """Delete blobs no manifest entry points to; returns how many were removed.
+
+        Workers that still map a removed blob keep reading it (POSIX keeps the
+        inode alive until the last mapping is closed).
+        """
+        removed = 0
+        with _exclusive(os.path.join(self.directory, ".lock")), self._lock:
+            live = {e["sha256"] for e in self._current(force=True)["files"].values()}
+            for name in os.listdir(self.directory):
+                sha, _, kind = name.partition(".")
+                if sha and kind and not name.endswith((".tmp", ".json")) and sha not in live:
+                    os.remove(os.path.join(self.directory, name))
+                    removed += 1
+        return removed
+
+    def info(self):
+        with self._lock:
+            manifest = self._current()
+            return {
+                "version": manifest.get("version", 0),
+                "files": len(manifest["files"]),
+                "mapped_blobs": len(self._maps),
+                "mapped_bytes": sum(len(mf) for mf in self._maps.values()),
+                "published": self.published,
+            }
+
+
+store = SharedStore() if enabled else None
+
+
+def warm(contents):
+    """Publish every asset the app serves for ``contents`` (raw bytes and the sidebar thumbnail)."""
+    from portfolio import assets, images
+
+    paths = set()
+    for c in contents:
+        if c.profile.photo_path:
+            paths.add(c.profile.photo_path)
+            if os.path.exists(images.best(c.profile.photo_path)):
+                assets.thumbnail(images.best(c.profile.photo_path), 360)
+        paths.update(f"assets/{p.image}" for p in c.projects if p.image)
+        paths.update(cert.file for cert in c.certificates if cert.file)
+        if c.resume_pdf_path:
+            paths.add(c.resume_pdf_path)
+    for src in list(paths):
+        paths.update(v["path"] for v in images.variants(src))
+    for path in sorted(paths):
+        if os.path.exists(path):
+            assets.read_bytes(path)
+    return sorted(paths)
+
+
+if __name__ == "__main__":
+    # use the imported module, whose store is the one assets.cache writes through
+    from portfolio import content, shared
+
+    if shared.store is None:
+        sys.exit("PORTFOLIO_SHARED_ASSETS=0: nothing to warm")
+    slugs = [n[:-5] for n in sorted(os.listdir(content.PROFILES_DIR)) if n.endswith(".json")] \
+        if os.path.isdir(content.PROFILES_DIR) else []
+    published = shared.warm([content.store.get()] + [content.profiles.get(s) for s in slugs])
+    print(f"{len(published)} assets, pruned {shared.store.prune()} stale blobs")
+    print(shared.store.info())
@@ -0,0 +1,96 @@
+# portfolio/snapshot.py — prebuilt startup state for fast cold starts
+# ----------------------------------------------------
+# Run at deploy time:  python -m portfolio.snapshot
+#
+# A fresh worker otherwise parses content/profile.json, compiles the records
+# and builds the intent index on its first rerun. build() does all of that
+# once (plus the image variants, stylesheet, retrieval matrix and resume
+# index, which have their own on-disk caches) and pickles the compiled Content and IntentIndex
+# to .cache/snapshot.pickle. boot() loads that pickle when it still matches
+# the content file's sha256 and seeds the stores; a stale or missing
+# snapshot is ignored and everything is built lazily as before.
+
+import hashlib
+import os
+import pickle
+import sys
+import threading
+
+from portfolio import content, intents
+from portfolio.cards import record_hash
+
+SNAPSHOT_PATH = os.path.join(".cache", "snapshot.pickle")
+VERSION = 2
+
+
+def _sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def build(path=SNAPSHOT_PATH, content_path=content.CONTENT_PATH):
+    """Compile everything the first rerun needs and pickle it to ``path``."""
+    from portfolio import images, resume, retrieval, styles
+
+    compiled = content.load(content_path)
+    index = intents.IntentIndex(intents.build_docs(compiled))
+    index.key = record_hash(compiled)
+    retrieval.retriever(compiled)
+    if compiled.resume_pdf_path and os.path.exists(compiled.resume_pdf_path):
+        try:
+            resume.build(compiled.resume_pdf_path)
+        except ImportError:
+            pass    # no pypdf here: resume answers need `python -m portfolio.resume`
+    images.build()
+    styles.sheet.link()     # writes static/style.<hash>.css
+
+    state = {
+        "version": VERSION,
+        "content_sha": _sha256(content_path),
+        "content": compiled,
+        "intents": index,
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return state
+
+
+def load(path=SNAPSHOT_PATH, content_path=content.CONTENT_PATH):
+    """The snapshot if it was built from the current content file, else None."""
+    try:
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if state.get("version") != VERSION or state.get("content_sha") != _sha256(content_path):
+            return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    return state
+
+
+_booted = {"done": False, "used": False}
+_boot_lock = threading.Lock()
+
+
+def boot(path=SNAPSHOT_PATH):
+    """Seed content.store and the intent engine from the snapshot, once per process."""
+    if _booted["done"]:
+        return _booted["used"]
+    with _boot_lock:
+        if not _booted["done"]:
+            state = load(path, content.store.path)
+            if state is not None:
+                compiled = content.intern(state["content"])
+                content.store.seed(compiled)
+                intents.seed(compiled, state["intents"])
+            _booted["used"] = state is not None
+            _booted["done"] = True
+    return _booted["used"]
+
+
+if __name__ == "__main__":
+    out = sys.argv[1] if len(sys.argv) > 1 else SNAPSHOT_PATH
+    state = build(out)
+    print(f"{out}: {os.path.getsize(out) // 1024} KB, content sha256 {state['content_sha'][:12]}")
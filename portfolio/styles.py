@@ -0,0 +1,90 @@
+# portfolio/styles.py — one minified, content-hashed stylesheet
+# ----------------------------------------------------
+# The page used to push two large <style> blocks through st.markdown on
+# every rerun and build inline style strings per card. All CSS now lives in
+# styles/*.css; it is merged, minified and hashed once per process (again
+# only if a file changes). With static serving it is published as
+# static/style.<hash>.css and linked, so the browser caches it; otherwise a
+# single minified <style> block is emitted.
+
+import hashlib
+import os
+import re
+import threading
+
+from portfolio import assets
+from portfolio.cards import SKILL_COLORS
+
+STYLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "styles")
+FILES = ("theme.css", "skills.css", "cards.css")
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+
+
+def minify(css):
+    css = _COMMENT_RE.sub("", css)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def _skill_palette():
+    # one class per pastel background, replacing the per-card inline color
+    return "".join(
+        f".skill-card.skill-bg-{i}{{background-color:{color}}}" for i, color in enumerate(SKILL_COLORS)
+    )
+
+
+class Stylesheet:
+    def __init__(self, directory=STYLES_DIR, files=FILES):
+        self.paths = [os.path.join(directory, name) for name in files]
+        self._lock = threading.Lock()
+        self._stamp = None
+        self.css = ""
+        self.digest = ""
+
+    def _refresh(self):
+        stamp = tuple(os.stat(p).st_mtime_ns for p in self.paths)
+        if stamp == self._stamp:
+            return
+        with self._lock:
+            parts = []
+            for path in self.paths:
+                with open(path, encoding="utf-8") as f:
+                    parts.append(f.read())
+            css = minify("\n".join(parts)) + _skill_palette()
+            self.css, self.digest = css, hashlib.sha256(css.encode()).hexdigest()[:12]
+            self._stamp = stamp
+
+    def inline(self):
+        self._refresh()
+        return f"<style>{self.css}</style>"
+
+    def link(self):
+        """<link> to static/style.<hash>.css, written once per content hash.
+
+        Falls back to the inline <style> block when static/ can't be written.
+        """
+        self._refresh()
+        css, digest = self.css, self.digest
+        name = f"style.{digest}.css"
+        path = os.path.join(assets.STATIC_DIR, name)
+        if not os.path.exists(path):
+            # per thread as well as per process: concurrent cold page loads all get here
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(assets.STATIC_DIR, exist_ok=True)
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(css)
+                os.replace(tmp, path)   # same name, same bytes: replacing a racing writer's copy is fine
+            except OSError:
+                if not os.path.exists(path):
+                    return f"<style>{css}</style>"
+        return f"<link rel='stylesheet' href='{assets.STATIC_URL}{name}'>"
+
+    def html(self, static=False):
+        return self.link() if static else self.inline()
+
+
+sheet = Stylesheet()
@@ -0,0 +1,119 @@
+import gc
+import json
+import os
+
+import pytest
+
+from portfolio import content
+
+
+def document(name="Ada Lovelace", skills=("Python", "SQL")):
+    return {
+        "profile": {"name": name, "role": "Data Scientist"},
+        "skills": [{"category": "Programming", "skills": list(skills)}],
+        "experience": [{"company": "Acme", "role": "Analyst", "period": "2023", "tech": ["SQL"]}],
+        "certificates": [],
+        "projects": [{"name": "Chatbot", "desc": "SQL chatbot", "tech": ["Python"]}],
+        "education": [{"school": "State University", "program": "MS", "period": "2024"}],
+    }
+
+
+def write(path, text, tick=[0]):
+    # bump the mtime explicitly: two writes within one clock tick look unchanged
+    tick[0] += 1
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(tick[0] * 10**9, tick[0] * 10**9))
+
+
+@pytest.fixture
+def profile_path(tmp_path):
+    path = tmp_path / "profile.json"
+    write(path, json.dumps(document()))
+    return path
+
+
+def test_compile_makes_hashable_records(profile_path):
+    c = content.load(str(profile_path))
+    assert c.skills[0].skills == ("Python", "SQL")
+    assert hash(c.experience[0]) == hash(content.load(str(profile_path)).experience[0])
+
+
+def test_reload_keeps_unchanged_records(profile_path):
+    store = content.ContentStore(str(profile_path), check_interval=0)
+    before = store.get()
+    write(profile_path, json.dumps(document(skills=("Python", "SQL", "Rust"))))
+    after = store.get()
+
+    assert store.version == 2
+    assert set(store.last_changes) == {"skills"}
+    assert after.skills[0].skills[-1] == "Rust"
+    assert after.experience[0] is before.experience[0]
+    assert after.profile is before.profile
+
+
+@pytest.mark.parametrize("broken", [
+    '{"profile": {"name": "Ada"',                  # half-written
+    '{"skills": []}',                             # no profile
+    '{"profile": {"name": "Ada", "colour": 1}}',   # missing role
+])
+def test_invalid_edit_keeps_last_good_content(profile_path, broken):
+    store = content.ContentStore(str(profile_path), check_interval=0)
+    good = store.get()
+    write(profile_path, broken)
+
+    assert store.get() is good
+    assert store.get() is good
+    assert store.errors == 1
+    assert store.version == 1
+
+    write(profile_path, json.dumps(document(name="Ada King")))
+    assert store.get().profile.name == "Ada King"
+
+
+def test_missing_file_keeps_last_good_content(profile_path):
+    store = content.ContentStore(str(profile_path), check_interval=0)
+    good = store.get()
+    profile_path.unlink()
+    assert store.get() is good
+
+
+def test_first_load_still_raises(tmp_path):
+    path = tmp_path / "profile.json"
+    write(path, "{")
+    with pytest.raises(ValueError):
+        content.ContentStore(str(path)).get()
+
+
+def test_intern_shares_equal_records_across_profiles():
+    a = content.intern(content.compile_content(document(name="Ada")))
+    b = content.intern(content.compile_content(document(name="Grace")))
+    assert a.experience[0] is b.experience[0]
+    assert a.profile is not b.profile
+
+
+def test_dropped_profiles_are_collected():
+    kept = content.intern(content.compile_content(document()))
+    for n in range(50):
+        content.intern(content.compile_content(document(name=f"Visitor {n}", skills=(f"Skill {n}",))))
+    gc.collect()
+
+    live = list(content._interned.values())
+    assert not [r for r in live if isinstance(r, content.Profile) and r.name.startswith("Visitor")]
+    assert not [r for r in live if isinstance(r, content.SkillGroup) and r.skills[0].startswith("Skill")]
+    assert kept.profile in live and kept.skills[0] in live
+
+
+def test_profiles_lru(tmp_path):
+    for slug in ("ada", "grace", "hedy"):
+        write(tmp_path / f"{slug}.json", json.dumps(document(name=slug.title())))
+    profiles = content.Profiles(str(tmp_path), max_profiles=2)
+
+    assert profiles.get("ada").profile.name == "Ada"
+    profiles.get("grace")
+    profiles.get("ada")
+    profiles.get("hedy")    # evicts grace, the least recently used
+    assert list(profiles._stores) == ["ada", "hedy"]
+    assert profiles.info()["evictions"] == 1
+    for bad in ("nobody", "../profile", "Ada"):
+        with pytest.raises(KeyError):
+            profiles.get(bad)
@@ -0,0 +1,46 @@
+import os
+import time
+
+from portfolio import events
+
+
+def test_events_are_written_and_read_back(tmp_path):
+    log = events.EventLog(str(tmp_path), flush_interval=0.01)
+    log.emit("session", session="a")
+    log.emit("chat", session="a", question="Visa status?")
+    log.close()
+
+    assert [e["kind"] for e in events.read(str(tmp_path))] == ["session", "chat"]
+    assert [e["question"] for e in events.read(str(tmp_path), kinds={"chat"})] == ["Visa status?"]
+    assert log.info()["written"] == 2
+
+
+def test_segments_rotate_by_size_and_are_gzipped(tmp_path):
+    log = events.EventLog(str(tmp_path), segment_bytes=200, flush_interval=0.01)
+    for n in range(80):
+        log.emit("tab", session=str(n), tab="Skills")
+        if n % 5 == 4:
+            # let the writer drain, so batches (and segments) stay small
+            while log.info()["written"] < n + 1:
+                time.sleep(0.001)
+    log.close()
+
+    paths = events.segments(str(tmp_path))
+    assert len(paths) > 1
+    assert all(p.endswith(".jsonl.gz") for p in paths)
+    assert len({os.path.basename(p) for p in paths}) == len(paths)
+    assert [e["session"] for e in events.read(str(tmp_path))] == [str(n) for n in range(80)]
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    log = events.EventLog(str(tmp_path), queue_size=3)
+    log._thread = object()      # no writer: nothing drains the queue
+    for n in range(5):
+        log.emit("tab", session=str(n))
+    assert log.info()["emitted"] == 3
+    assert log.info()["dropped"] == 2
+
+
+def test_truncated_lines_are_skipped(tmp_path):
+    (tmp_path / "events-1-1-0.jsonl").write_text('{"kind": "chat", "ts": 1}\n{"kind": "ch', encoding="utf-8")
+    assert [e["kind"] for e in events.read(str(tmp_path))] == ["chat"]
@@ -0,0 +1,24 @@
+from portfolio import content, intents
+
+
+def profile(**extra):
+    return content.compile_content({
+        "profile": {"name": "Ada Lovelace", "role": "Analyst", **extra},
+        "experience": [{"company": "Acme", "role": "Analyst", "period": "2023"}],
+    })
+
+
+def test_visa_topic_only_for_profiles_that_set_it():
+    with_visa = intents.IntentIndex(intents.build_docs(profile(visa="Authorized to work in the UK.")))
+    assert with_visa.search("what is your visa status", k=1)[0][1:] == ("visa", "Authorized to work in the UK.")
+
+    without = intents.IntentIndex(intents.build_docs(profile()))
+    assert "visa" not in {kind for kind, _ in without.docs}
+    assert all(kind != "visa" for _, kind, _ in without.search("visa sponsorship"))
+
+
+def test_experience_summary_names_the_profile_impact():
+    answers = dict(intents.IntentIndex(intents.build_docs(profile(impact="forecasting"))).docs)
+    assert answers["experience"] == "I have 1 professional role(s) listed, with impact in forecasting."
+    assert dict(intents.IntentIndex(intents.build_docs(profile())).docs)["experience"] \
+        == "I have 1 professional role(s) listed."
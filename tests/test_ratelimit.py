@@ -0,0 +1,66 @@
+import pytest
+
+from portfolio import ratelimit
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_bucket_allows_a_burst_then_refills(clock):
+    limiter = ratelimit.RateLimiter(rate=0.5, burst=3)
+    assert [limiter.allow("s") for _ in range(4)] == [True, True, True, False]
+    clock[0] += 2.0     # one token back
+    assert [limiter.allow("s") for _ in range(2)] == [True, False]
+    assert limiter.info() == {"keys": 1, "allowed": 4, "limited": 2}
+
+
+def test_keys_are_independent_and_lru_bounded(clock):
+    limiter = ratelimit.RateLimiter(rate=0.5, burst=1, max_keys=2)
+    assert limiter.allow("a") and limiter.allow("b")
+    assert not limiter.allow("a")
+    limiter.allow("c")      # evicts b, the least recently used
+    assert list(limiter._buckets) == ["a", "c"]
+    assert limiter.allow("b")
+
+
+def test_guard_refuses_with_slow_down_answer(clock):
+    guard = ratelimit.ChatGuard(rate=0.5, burst=1, concurrency=2)
+    with guard.admit("s") as refused:
+        assert refused is None
+    with guard.admit("s") as refused:
+        assert refused == ratelimit.SLOW_DOWN_ANSWER
+
+
+def test_guard_caps_concurrent_answers(clock):
+    guard = ratelimit.ChatGuard(rate=0.5, burst=5, concurrency=1)
+    with guard.admit("a") as first:
+        assert first is None
+        assert guard.info()["in_flight"] == 1
+        with guard.admit("b") as second:
+            assert second == ratelimit.BUSY_ANSWER
+    assert guard.info()["in_flight"] == 0
+    assert guard.info()["busy"] == 1
+    with guard.admit("b") as third:
+        assert third is None
+
+
+def test_slot_is_released_when_the_answer_fails(clock):
+    guard = ratelimit.ChatGuard(rate=0.5, burst=5, concurrency=1)
+    with pytest.raises(RuntimeError):
+        with guard.admit("a"):
+            raise RuntimeError("backend down")
+    with guard.admit("a") as refused:
+        assert refused is None
+
+
+def test_ip_bucket_is_shared_by_sessions(clock):
+    guard = ratelimit.ChatGuard(rate=0.5, burst=1, concurrency=4, by_ip=True)
+    admitted = 0
+    for n in range(10):
+        with guard.admit(f"session-{n}", "10.0.0.1") as refused:
+            admitted += refused is None
+    assert admitted == 4    # the IP bucket holds 4x a session's burst
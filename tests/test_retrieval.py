@@ -0,0 +1,44 @@
+import threading
+
+from portfolio import content, retrieval
+
+
+def profile(n):
+    return content.compile_content({
+        "profile": {"name": f"Ada {n}", "role": "Analyst"},
+        "experience": [{"company": "Acme", "role": "Analyst", "period": "2023",
+                        "bullets": [f"Built forecasting pipeline number {n} in Python"], "tech": ["Python"]}],
+        "projects": [{"name": "Chatbot", "desc": "Answers questions over SQL databases", "tech": ["SQL"]}],
+    })
+
+
+def test_cold_retriever_is_built_once_under_concurrent_first_questions(tmp_path):
+    for trial in range(10):
+        c = profile(trial)
+        results, errors = [], []
+
+        def ask():
+            try:
+                results.append(retrieval.retriever(c, str(tmp_path)))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=ask) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors
+        assert len({id(r) for r in results}) == 1
+        assert results[0].search("forecasting pipeline")[0][1]["kind"] == "experience"
+
+
+def test_truncated_index_is_rebuilt(tmp_path, monkeypatch):
+    c = profile("truncated")
+    built = retrieval.retriever(c, str(tmp_path))
+    (tmp_path / f"{built.key}.idf.npy").write_bytes(b"")     # np.load raises EOFError
+    monkeypatch.setattr(retrieval, "_retrievers", content.PerContent())
+
+    rebuilt = retrieval.retriever(c, str(tmp_path))
+    assert rebuilt is not built and rebuilt.key == built.key
+    assert len(rebuilt.idf) == len(built.idf)
@@ -0,0 +1,75 @@
+import gc
+
+from portfolio import cards, content, search
+
+
+def target(name):
+    return ("skills", name, f"skill-{name.lower()}")
+
+
+def make_index(k=8):
+    entries = [
+        ("Python", target("Programming")),
+        ("Python", target("Projects")),
+        ("PyTorch", target("Libraries")),
+        ("PyCharm", target("Tools")),
+        ("Random Forest", target("ML")),
+        ("SQL", target("Databases")),
+        ("MySQL", target("Databases")),
+    ]
+    return search.TypeaheadIndex(entries, k=k)
+
+
+def test_prefix_matches_rank_terms_on_more_cards_first():
+    hits = make_index().suggest("py")
+    assert [h.label for h in hits] == ["Python", "PyCharm", "PyTorch"]
+    assert len(hits[0].targets) == 2
+    assert {h.match for h in hits} == {"prefix"}
+
+
+def test_prefix_matches_any_word_start():
+    assert [h.label for h in make_index().suggest("fores")] == ["Random Forest"]
+
+
+def test_typos_fall_back_to_trigrams():
+    hits = make_index().suggest("pytroch")
+    assert hits[0].label == "PyTorch"
+    assert hits[0].match == "fuzzy"
+
+
+def test_prefix_hits_come_before_fuzzy_ones():
+    hits = make_index().suggest("sql")
+    assert [(h.label, h.match) for h in hits] == [("SQL", "prefix"), ("MySQL", "fuzzy")]
+
+
+def test_results_are_capped_at_k():
+    assert len(make_index(k=2).suggest("py")) == 2
+
+
+def test_no_match_and_blank_queries():
+    index = make_index()
+    assert index.suggest("zzz") == []
+    assert index.suggest("  ") == []
+
+
+def test_entries_point_at_card_anchors():
+    c = content.compile_content({
+        "profile": {"name": "Ada", "role": "Analyst"},
+        "skills": [{"category": "Programming", "skills": ["Python"]}],
+        "projects": [{"name": "Chatbot", "desc": "SQL chatbot", "tech": ["Python"]}],
+    })
+    [python] = search.TypeaheadIndex(search.entries(c)).suggest("python")
+    assert python.targets == (
+        ("skills", "Programming", cards.anchor("skill", c.skills[0])),
+        ("projects", "Chatbot", cards.anchor("project", c.projects[0])),
+    )
+
+
+def test_anchors_do_not_keep_records_alive():
+    before = len(cards._anchors)
+    records = [content.Project(name=f"Project {n}", desc="") for n in range(20)]
+    anchors = {cards.anchor("project", r) for r in records}
+    assert len(anchors) == 20
+    del records
+    gc.collect()
+    assert len(cards._anchors) == before
@@ -0,0 +1,34 @@
+import os
+import threading
+
+from portfolio import assets, styles
+
+
+def test_concurrent_cold_links_publish_one_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "STATIC_DIR", str(tmp_path / "static"))
+    links, errors = [], []
+
+    def load():
+        try:
+            links.append(styles.Stylesheet().link())
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert len(set(links)) == 1
+    sheet = styles.Stylesheet()
+    sheet.inline()
+    assert os.listdir(tmp_path / "static") == [f"style.{sheet.digest}.css"]
+
+
+def test_unwritable_static_dir_falls_back_to_inline(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setattr(assets, "STATIC_DIR", str(blocker / "static"))    # a path under a file
+    sheet = styles.Stylesheet()
+    assert sheet.link() == sheet.inline()